@@ -4,6 +4,7 @@ Polymarket Top-of-Book Market Maker - Configuration Module
 Loads and validates all environment variables and hyperparameters.
 """
 
+import functools
 import math
 import os
 from dataclasses import dataclass, field
@@ -13,7 +14,56 @@ from typing import Optional
 from dotenv import load_dotenv
 
 
-@dataclass
+# Order-size decay lookup table: eta is fixed at config load, so
+# exp(-eta * |inv|) is tabulated once and interpolated at query time
+_EXP_TABLE_SIZE = 1024
+_EXP_TABLE_MAX_INV = 200.0  # tokens; exact math.exp beyond this (cold path)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_env_cached(path: str, mtime_ns: int) -> bool:
+    """
+    Parse a .env file into os.environ, cached by (path, mtime).
+
+    Repeated config loads within one process (tests, hot-reload) skip the
+    file I/O and parsing entirely unless the file changed on disk.
+    """
+    return load_dotenv(path)
+
+
+def _load_env(env_path: Optional[str]) -> None:
+    """Load the .env file for load_config, using the mtime-keyed cache."""
+    if env_path is None:
+        for candidate in (".env", "src/.env"):
+            if Path(candidate).exists():
+                env_path = candidate
+                break
+    if env_path is None:
+        # No known file - let dotenv do its own search
+        load_dotenv()
+        return
+    try:
+        mtime_ns = os.stat(env_path).st_mtime_ns
+    except OSError:
+        load_dotenv(env_path)
+        return
+    _load_env_cached(env_path, mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _derive_address(private_key: str) -> str:
+    """
+    Derive the wallet address for a private key.
+
+    eth_account is slow to import (it drags in coincurve/eth_keys) and the
+    EC pubkey recovery isn't free either, so the import happens lazily and
+    the key -> address mapping is cached for repeated config loads.
+    """
+    from eth_account import Account
+    return Account.from_key(private_key).address
+
+
+@dataclass(slots=True)
 class Config:
     """Configuration container for the market maker strategy."""
     
@@ -38,13 +88,25 @@ class Config:
     log_level: str
     refresh_interval: float  # How often to refresh quotes (seconds)
     ws_reconnect_delay: int
+    max_orders_per_sec: float = 4.0  # Order/cancel rate budget (token bucket)
     
     # Derived wallet address (computed after loading)
     wallet_address: str = field(default="")
     
     # Active market end date (set by discovery)
     active_market_end_date: Optional[datetime] = None
-    
+
+    # Precomputed exp(-eta * |inv|) table (see __post_init__)
+    _exp_table: Optional[list[float]] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        if self.order_size_eta > 0:
+            step = _EXP_TABLE_MAX_INV / (_EXP_TABLE_SIZE - 1)
+            eta = self.order_size_eta
+            self._exp_table = [
+                math.exp(-eta * i * step) for i in range(_EXP_TABLE_SIZE)
+            ]
+
     def compute_skew(self, inventory: float) -> float:
         """
         Compute price skew based on current inventory.
@@ -71,25 +133,43 @@ class Config:
         
         This reduces order size exponentially as inventory grows,
         limiting risk exposure when positions accumulate.
-        
+
+        eta is fixed at load time, so the decay curve is tabulated once in
+        __post_init__ and linearly interpolated here - an index plus one
+        multiply instead of a libm exp() per refresh tick.
+
         Args:
             inventory: Net inventory (Q_yes - Q_no)
-            
+
         Returns:
             float: Adjusted order size (minimum 5.0 for Polymarket)
         """
         if self.order_size_eta <= 0:
             return self.order_size
-        
-        decay = math.exp(-self.order_size_eta * abs(inventory))
-        size = self.order_size * decay
-        return max(5.0, size)  # Polymarket minimum
+
+        table = self._exp_table
+        x = abs(inventory)
+        if x >= _EXP_TABLE_MAX_INV:
+            # Past the table span the clamp would overstate the decay
+            # factor for small eta (a risk control must not round up);
+            # this is a cold path, so pay the exact exp()
+            decay = math.exp(-self.order_size_eta * x)
+        else:
+            pos = x * (_EXP_TABLE_SIZE - 1) / _EXP_TABLE_MAX_INV
+            idx = int(pos)
+            frac = pos - idx
+            decay = table[idx] + (table[idx + 1] - table[idx]) * frac
+        return max(5.0, self.order_size * decay)  # Polymarket minimum
     
-    def get_market_expiry(self) -> datetime:
+    def get_market_expiry(self, now: Optional[datetime] = None) -> datetime:
         """
         Get market expiry time.
         Uses the discovered market end date if available.
 
+        Args:
+            now: Current time, if the caller already has it for this tick.
+                 Defaults to datetime.now().
+
         Returns:
             datetime: When the market expires
         """
@@ -99,15 +179,18 @@ class Config:
             return self.active_market_end_date.astimezone().replace(tzinfo=None)
 
         # Fallback: calculate next quarter-hour boundary
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         minute = (now.minute // 15) * 15
         current_slot = now.replace(minute=minute, second=0, microsecond=0)
         next_expiry = current_slot + timedelta(minutes=15)
         return next_expiry
-    
-    def time_until_expiry(self) -> timedelta:
+
+    def time_until_expiry(self, now: Optional[datetime] = None) -> timedelta:
         """Get time remaining until market expiry."""
-        return self.get_market_expiry() - datetime.now()
+        if now is None:
+            now = datetime.now()
+        return self.get_market_expiry(now) - now
 
 
 def load_config(env_path: Optional[str] = None) -> Config:
@@ -123,37 +206,33 @@ def load_config(env_path: Optional[str] = None) -> Config:
     Raises:
         ValueError: If required configuration is missing or invalid
     """
-    # Load .env file
-    if env_path:
-        load_dotenv(env_path)
-    else:
-        if Path(".env").exists():
-            load_dotenv(".env")
-        elif Path("src/.env").exists():
-            load_dotenv("src/.env")
-        else:
-            load_dotenv()
-    
+    # Load .env file (parse cached by path + mtime)
+    _load_env(env_path)
+
+    # Snapshot the environment once instead of hitting the os.environ
+    # mapping wrapper per key
+    env = dict(os.environ)
+
     def get_required(key: str) -> str:
-        value = os.getenv(key)
+        value = env.get(key)
         if not value:
             raise ValueError(f"Required environment variable {key} is not set")
         return value
-    
+
     def get_float(key: str, default: float) -> float:
-        value = os.getenv(key)
+        value = env.get(key)
         if value is None:
             return default
         return float(value)
-    
+
     def get_int(key: str, default: int) -> int:
-        value = os.getenv(key)
+        value = env.get(key)
         if value is None:
             return default
         return int(value)
-    
+
     def get_str(key: str, default: str) -> str:
-        return os.getenv(key, default)
+        return env.get(key, default)
     
     # Market IDs are optional - can be discovered automatically
     condition_id = get_str("CONDITION_ID", "")
@@ -187,13 +266,12 @@ def load_config(env_path: Optional[str] = None) -> Config:
         log_level=get_str("LOG_LEVEL", "INFO"),
         refresh_interval=refresh_interval,
         ws_reconnect_delay=get_int("WS_RECONNECT_DELAY", 10),
+        max_orders_per_sec=get_float("MAX_ORDERS_PER_SEC", 4.0),
     )
     
-    # Derive wallet address from private key
+    # Derive wallet address from private key (cached across reloads)
     try:
-        from eth_account import Account
-        account = Account.from_key(config.private_key)
-        config.wallet_address = account.address
+        config.wallet_address = _derive_address(config.private_key)
     except Exception as e:
         raise ValueError(f"Invalid private key: {e}")
     
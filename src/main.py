@@ -6,56 +6,73 @@ and runs continuously, switching to the next market after each expiry.
 """
 
 import asyncio
+import logging
+import os
 import signal
-import sys
+
+try:
+    # C event loop: noticeably faster callback dispatch for an
+    # await-heavy process; absent on Windows, optional elsewhere
+    import uvloop
+except ImportError:
+    uvloop = None
 
 from config import init_config
 from logger import setup_logging, get_logger
 from polymarket_client import init_client
-from orderbook_manager import init_orderbook_manager
+from orderbook_manager import (
+    init_orderbook_manager,
+    load_tracked_order_ids,
+    clear_tracked_order_ids,
+)
 from user_channel import init_user_channel
 from market_discovery import MarketDiscovery
+from safety import seconds_until_expiry
 from strategy_engine import StrategyEngine
 
 
-async def discover_and_set_market(cfg, log):
+async def discover_and_set_market(discovery, cfg, log):
     """
     Discover the next BTC market and update config.
-    
+
+    The MarketDiscovery instance is shared across sessions so rollover
+    reuses its warm Gamma API connection instead of paying a fresh TLS
+    handshake at the moment a new market needs picking.
+
     Returns:
         dict: Market info with title, end_date, etc.
     """
     log.info("Discovering BTC 15-minute markets...")
-    
-    discovery = MarketDiscovery(cfg)
-    try:
-        market = await discovery.find_next_market()
-        
-        if not market:
-            raise RuntimeError("No BTC 15-minute market found on Polymarket")
-        
-        # Update config with discovered market IDs
-        cfg.condition_id = market["condition_id"]
-        cfg.token_id_yes = market["token_id_up"]
-        cfg.token_id_no = market["token_id_down"]
-        cfg.active_market_end_date = market["end_date"]
-        
-        log.info(f"Selected market: {market['title']}")
-        log.info(f"  Slug: {market['slug']}")
-        log.info(f"  Condition ID: {cfg.condition_id}")
-        log.info(f"  End time: {market['end_date']}")
-        log.info(f"  Up (YES) token: {cfg.token_id_yes[:32]}...")
-        log.info(f"  Down (NO) token: {cfg.token_id_no[:32]}...")
-        
-        return market
-    finally:
-        await discovery.close()
 
+    market = await discovery.find_next_market()
+
+    if not market:
+        raise RuntimeError("No BTC 15-minute market found on Polymarket")
+
+    # Update config with discovered market IDs
+    cfg.condition_id = market["condition_id"]
+    cfg.token_id_yes = market["token_id_up"]
+    cfg.token_id_no = market["token_id_down"]
+    cfg.active_market_end_date = market["end_date"]
+
+    log.info(f"Selected market: {market['title']}")
+    log.info(f"  Slug: {market['slug']}")
+    log.info(f"  Condition ID: {cfg.condition_id}")
+    log.info(f"  End time: {market['end_date']}")
+    log.info(f"  Up (YES) token: {cfg.token_id_yes[:32]}...")
+    log.info(f"  Down (NO) token: {cfg.token_id_no[:32]}...")
 
-def prompt_sell_tokens(log, inv, cfg) -> tuple[bool, float, float]:
+    return market
+
+
+async def prompt_sell_tokens(log, inv, cfg) -> tuple[bool, float, float]:
     """
     Prompt user whether to sell tokens on manual stop (Cmd+C).
-    
+
+    The blocking input() runs in a worker thread so the event loop
+    (websocket heartbeats, pending cancels) keeps turning while the
+    user decides.
+
     Returns (should_sell, yes_amount, no_amount).
     """
     has_yes = inv.q_yes > 0.01
@@ -94,8 +111,9 @@ def prompt_sell_tokens(log, inv, cfg) -> tuple[bool, float, float]:
     print()
     
     try:
-        response = input("Sell or keep? [s/K]: ").strip().lower()
-        should_sell = response in ('s', 'sell', 'y', 'yes')
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(None, input, "Sell or keep? [s/K]: ")
+        should_sell = response.strip().lower() in ('s', 'sell', 'y', 'yes')
         return should_sell, inv.q_yes if has_yes else 0.0, inv.q_no if has_no else 0.0
     except (EOFError, KeyboardInterrupt):
         return False, 0.0, 0.0
@@ -110,11 +128,22 @@ async def run_single_market(cfg, client, log, stop_event):
     """
     log.info("🧹 Cleaning up any stale orders before starting...")
     try:
-        cancelled = await client.cancel_all_orders()
-        if cancelled and cancelled > 0:
-            log.info(f"   Cancelled {cancelled} stale orders")
-        else:
-            log.info("   No stale orders to cancel")
+        # A previous session persists its tracked ids on shutdown; if we
+        # have them, one batch cancel beats the list-then-cancel sweep
+        stale_ids = load_tracked_order_ids(cfg.condition_id)
+        batch_cancelled = set()
+        if stale_ids:
+            batch_cancelled = await client.cancel_orders(stale_ids)
+            clear_tracked_order_ids(cfg.condition_id)
+            if batch_cancelled:
+                log.info(f"   Batch-cancelled {len(batch_cancelled)} persisted orders")
+
+        if not batch_cancelled:
+            cancelled = await client.cancel_all_orders()
+            if cancelled and cancelled > 0:
+                log.info(f"   Cancelled {cancelled} stale orders")
+            else:
+                log.info("   No stale orders to cancel")
     except Exception as e:
         log.warning(f"   Could not cancel stale orders: {e}")
     
@@ -135,10 +164,15 @@ async def run_single_market(cfg, client, log, stop_event):
     await engine.start()
     
     log.info("Strategy engine running on current market...")
-    
+
+    # Sleep until the stop signal or market expiry, whichever comes
+    # first - no 1s polling wakeups, and a Ctrl+C lands within one
+    # event-loop tick instead of up to a second later
     try:
-        while not stop_event.is_set():
-            await asyncio.sleep(1)
+        timeout = max(0.0, seconds_until_expiry(cfg))
+        await asyncio.wait_for(stop_event.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass  # Market expired - roll to the next session
     except asyncio.CancelledError:
         pass
     
@@ -148,7 +182,7 @@ async def run_single_market(cfg, client, log, stop_event):
     user_stopped = stop_event.is_set()
     
     if user_stopped:
-        should_sell, _, _ = prompt_sell_tokens(log, engine.state.inventory, cfg)
+        should_sell, _, _ = await prompt_sell_tokens(log, engine.state.inventory, cfg)
         await engine.stop(sell_tokens=should_sell)
     else:
         await engine.stop(sell_tokens=False)
@@ -177,6 +211,9 @@ async def main():
     signal_count = [0]
 
     def _handle_signal():
+        # First signal: graceful - set stop_event and let the session
+        # wind down. Second: hard exit via os._exit, because SystemExit
+        # can hang on blocking CLOB calls still running in worker threads
         signal_count[0] += 1
         if signal_count[0] == 1:
             print("\n")
@@ -185,40 +222,53 @@ async def main():
         elif signal_count[0] >= 2:
             print("\n")
             log.info("🛑 Force quit!")
-            sys.exit(1)
+            logging.shutdown()
+            os._exit(130)
 
     loop = asyncio.get_running_loop()
     for sig in (signal.SIGINT, signal.SIGTERM):
         try:
             loop.add_signal_handler(sig, _handle_signal)
         except NotImplementedError:
-            pass
+            # Windows: no add_signal_handler on the Proactor loop. Fall
+            # back to signal.signal and hop onto the loop thread-safely
+            # so Ctrl+C still sets stop_event instead of raising
+            # KeyboardInterrupt mid-request
+            signal.signal(sig, lambda *_: loop.call_soon_threadsafe(_handle_signal))
+
+    # One discovery instance for the whole process: each session reuses
+    # its connection instead of rebuilding it per rollover
+    discovery = MarketDiscovery(cfg)
 
     market_count = 0
-    while not stop_event.is_set():
-        market_count += 1
-        log.info(f"\n{'='*60}")
-        log.info(f"Market Session #{market_count}")
-        log.info(f"{'='*60}")
-        
-        try:
-            market = await discover_and_set_market(cfg, log)
-            should_continue = await run_single_market(cfg, client, log, stop_event)
-            
-            if not should_continue:
-                break
-            
-        except Exception as e:
-            log.error(f"Error in market session: {e}")
-            if not stop_event.is_set():
-                log.info("Retrying in 15 seconds...")
-                await asyncio.sleep(15)
-
-    await client.close()
-    log.info("Shutdown complete.")
+    try:
+        while not stop_event.is_set():
+            market_count += 1
+            log.info(f"\n{'='*60}")
+            log.info(f"Market Session #{market_count}")
+            log.info(f"{'='*60}")
+
+            try:
+                market = await discover_and_set_market(discovery, cfg, log)
+                should_continue = await run_single_market(cfg, client, log, stop_event)
+
+                if not should_continue:
+                    break
+
+            except Exception as e:
+                log.error(f"Error in market session: {e}")
+                if not stop_event.is_set():
+                    log.info("Retrying in 15 seconds...")
+                    await asyncio.sleep(15)
+    finally:
+        await discovery.close()
+        await client.close()
+        log.info("Shutdown complete.")
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
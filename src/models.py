@@ -4,13 +4,31 @@ Polymarket Top-of-Book Market Maker - Data Models
 Data models for inventory state, orders, and orderbook data.
 """
 
+import bisect
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Dict, Any
-import json
+from typing import Optional, Dict, Any, Sequence
 from pathlib import Path
 
+import orjson
+
+# Prices are 0.00-1.00 in 0.01 increments; working in integer ticks
+# keeps hot-path comparisons and arithmetic exact, with floats only at
+# the display/API boundary
+Price = int  # a price expressed in integer ticks
+PRICE_SCALE = 100  # ticks per dollar at Polymarket's 0.01 increment
+
+
+def price_to_ticks(price: float) -> Price:
+    """Convert a float price to integer ticks."""
+    return round(price * PRICE_SCALE)
+
+
+def ticks_to_price(ticks: Price) -> float:
+    """Convert integer ticks back to a float price."""
+    return ticks / PRICE_SCALE
+
 
 class Side(str, Enum):
     """Order side."""
@@ -42,63 +60,219 @@ class StrategyMode(str, Enum):
     STOPPED = "STOPPED"  # Strategy stopped (manual or expiry)
 
 
-@dataclass
+# Parent directories already created by a save() this process; lets the
+# checkpoint path skip the mkdir stat calls after the first write
+_prepared_dirs: set = set()
+
+
+def _ensure_parent(path: Path):
+    """mkdir -p the parent directory once per process."""
+    parent = str(path.parent)
+    if parent not in _prepared_dirs:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _prepared_dirs.add(parent)
+
+
+def _parse_ts(value) -> Optional[datetime]:
+    """Accept either an ISO string (from disk) or a datetime (in-memory dict)."""
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def _apply_fill(q: float, c: float, price: float, size: float,
+                is_buy: bool) -> tuple[float, float, float]:
+    """
+    Core fill arithmetic on one (quantity, cost) pair.
+
+    Kept as a module-level function of plain floats - no self, no enums -
+    so it stays trivially JIT-compilable should the refresh loop ever get
+    fast enough to warrant numba/Cython.
+
+    Returns:
+        (new_quantity, new_cost, realized_pnl_delta)
+    """
+    if is_buy:
+        return q + size, c + price * size, 0.0
+    if q <= 0:
+        return q, c, 0.0
+    avg_cost = c / q
+    sell_amount = size if size < q else q
+    realized = (price - avg_cost) * sell_amount
+    c -= avg_cost * sell_amount
+    q = q - size
+    return (q if q > 0 else 0), c, realized
+
+
+@dataclass(slots=True)
 class OrderBookLevel:
     """Single level in the order book."""
     price: float
     size: float
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderBook:
     """Order book snapshot for one outcome."""
     asset_id: str
     bids: list[OrderBookLevel] = field(default_factory=list)
     asks: list[OrderBookLevel] = field(default_factory=list)
     timestamp: datetime = field(default_factory=datetime.now)
-    
+
+    # Cached best-of-book, maintained incrementally so the hot quote loop
+    # doesn't re-scan the level lists on every read
+    _best_bid: Optional[float] = field(default=None, init=False, repr=False)
+    _best_ask: Optional[float] = field(default=None, init=False, repr=False)
+
+    # Structure-of-arrays mirror of the level lists: parallel price/size
+    # arrays so aggregate math scans plain floats instead of chasing
+    # OrderBookLevel objects. Both sides are kept sorted by ascending
+    # price (bisect-maintained), so best bid = last entry, best ask =
+    # first entry, and level updates are O(log n) lookups.
+    _bid_prices: list[float] = field(default_factory=list, init=False, repr=False)
+    _bid_sizes: list[float] = field(default_factory=list, init=False, repr=False)
+    _ask_prices: list[float] = field(default_factory=list, init=False, repr=False)
+    _ask_sizes: list[float] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self):
+        self.bids.sort(key=lambda level: level.price)
+        self.asks.sort(key=lambda level: level.price)
+        self._bid_prices = [level.price for level in self.bids]
+        self._bid_sizes = [level.size for level in self.bids]
+        self._ask_prices = [level.price for level in self.asks]
+        self._ask_sizes = [level.size for level in self.asks]
+        self._best_bid = self._bid_prices[-1] if self._bid_prices else None
+        self._best_ask = self._ask_prices[0] if self._ask_prices else None
+
     @property
     def best_bid(self) -> Optional[float]:
         """Best bid price (highest)."""
-        if not self.bids:
-            return None
-        return max(level.price for level in self.bids)
-    
+        return self._best_bid
+
     @property
     def best_ask(self) -> Optional[float]:
         """Best ask price (lowest)."""
-        if not self.asks:
-            return None
-        return min(level.price for level in self.asks)
-    
+        return self._best_ask
+
+    def top_signature(self, depth: int = 5) -> int:
+        """
+        Hash of the top `depth` levels on both sides.
+
+        Cheap identity check for polled snapshots: two books with the
+        same signature carry the same actionable top-of-book, so
+        consumers can skip recomputation on no-op updates.
+        """
+        return hash((
+            tuple(self._bid_prices[-depth:]),
+            tuple(self._bid_sizes[-depth:]),
+            tuple(self._ask_prices[:depth]),
+            tuple(self._ask_sizes[:depth]),
+        ))
+
     @property
     def mid_price(self) -> Optional[float]:
         """Mid price."""
-        if self.best_bid is None or self.best_ask is None:
+        bid = self._best_bid
+        ask = self._best_ask
+        if bid is None or ask is None:
             return None
-        return (self.best_bid + self.best_ask) / 2
-    
+        return (bid + ask) / 2
+
     @property
     def spread(self) -> Optional[float]:
         """Bid-ask spread."""
-        if self.best_bid is None or self.best_ask is None:
+        bid = self._best_bid
+        ask = self._best_ask
+        if bid is None or ask is None:
             return None
-        return self.best_ask - self.best_bid
-    
+        return ask - bid
+
+    def update_level(self, side: Side, price: float, size: float):
+        """
+        Insert, update, or remove (size <= 0) a single price level,
+        maintaining sorted order, the parallel arrays, and the cached
+        best bid/ask. O(log n) lookup, O(n) worst-case shift on insert.
+        """
+        if side is Side.BUY:
+            levels, prices, sizes = self.bids, self._bid_prices, self._bid_sizes
+        else:
+            levels, prices, sizes = self.asks, self._ask_prices, self._ask_sizes
+
+        i = bisect.bisect_left(prices, price)
+        if i < len(prices) and prices[i] == price:
+            if size <= 0:
+                del levels[i]
+                del prices[i]
+                del sizes[i]
+            else:
+                levels[i].size = size
+                sizes[i] = size
+        elif size > 0:
+            levels.insert(i, OrderBookLevel(price=price, size=size))
+            prices.insert(i, price)
+            sizes.insert(i, size)
+
+        # Sorted arrays make best-of-book an endpoint read
+        if side is Side.BUY:
+            self._best_bid = prices[-1] if prices else None
+        else:
+            self._best_ask = prices[0] if prices else None
+
+    def apply_delta(
+        self,
+        bids: Sequence[tuple[float, float]] = (),
+        asks: Sequence[tuple[float, float]] = (),
+    ):
+        """
+        Apply a batch of (price, size) level changes in place.
+
+        Each entry replaces the resting size at its price; size <= 0
+        removes the level. Only the changed prices are touched, so a
+        delta feed costs O(changes) level updates instead of rebuilding
+        the whole book object graph per tick.
+        """
+        for price, size in bids:
+            self.update_level(Side.BUY, price, size)
+        for price, size in asks:
+            self.update_level(Side.SELL, price, size)
+        self.timestamp = datetime.now()
+
+    @property
+    def bid_depth(self) -> float:
+        """Total size resting on the bid side."""
+        return sum(self._bid_sizes)
+
+    @property
+    def ask_depth(self) -> float:
+        """Total size resting on the ask side."""
+        return sum(self._ask_sizes)
+
+    def bid_vwap(self) -> Optional[float]:
+        """Size-weighted average bid price over the full book."""
+        depth = sum(self._bid_sizes)
+        if depth == 0:
+            return None
+        notional = sum(p * s for p, s in zip(self._bid_prices, self._bid_sizes))
+        return notional / depth
+
+    def ask_vwap(self) -> Optional[float]:
+        """Size-weighted average ask price over the full book."""
+        depth = sum(self._ask_sizes)
+        if depth == 0:
+            return None
+        notional = sum(p * s for p, s in zip(self._ask_prices, self._ask_sizes))
+        return notional / depth
+
     def get_best_bid_level(self) -> Optional[OrderBookLevel]:
         """Get the best bid level."""
-        if not self.bids:
-            return None
-        return max(self.bids, key=lambda x: x.price)
-    
+        return self.bids[-1] if self.bids else None
+
     def get_best_ask_level(self) -> Optional[OrderBookLevel]:
         """Get the best ask level."""
-        if not self.asks:
-            return None
-        return min(self.asks, key=lambda x: x.price)
+        return self.asks[0] if self.asks else None
 
 
-@dataclass
+@dataclass(slots=True)
 class LiveOrder:
     """Tracks a live order on the exchange."""
     order_id: str
@@ -111,17 +285,22 @@ class LiveOrder:
     status: OrderStatus = OrderStatus.PENDING
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
-    
+
+    # Statuses that count as active, precomputed once at class level
+    _ACTIVE_STATUSES = frozenset(
+        {OrderStatus.PENDING, OrderStatus.LIVE, OrderStatus.PARTIALLY_FILLED}
+    )
+
     @property
     def remaining_size(self) -> float:
         return self.size - self.filled_size
-    
+
     @property
     def is_active(self) -> bool:
-        return self.status in (OrderStatus.PENDING, OrderStatus.LIVE, OrderStatus.PARTIALLY_FILLED)
+        return self.status in LiveOrder._ACTIVE_STATUSES
 
 
-@dataclass
+@dataclass(slots=True)
 class InventoryState:
     """
     Portfolio inventory state for market making.
@@ -153,118 +332,158 @@ class InventoryState:
     # Timestamps
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
-    
-    @property
-    def mu_yes(self) -> float:
-        """VWAP (average cost) for YES position."""
-        if self.q_yes == 0:
-            return 0.0
-        return self.c_yes / self.q_yes
-    
-    @property
-    def mu_no(self) -> float:
-        """VWAP (average cost) for NO position."""
-        if self.q_no == 0:
-            return 0.0
-        return self.c_no / self.q_no
-    
-    @property
-    def delta_q(self) -> float:
-        """Net inventory imbalance: ΔQ = Q_yes - Q_no"""
-        return self.q_yes - self.q_no
-    
-    @property
-    def total_position(self) -> float:
-        """Total tokens held (YES + NO)."""
-        return self.q_yes + self.q_no
-    
-    @property
-    def total_cost(self) -> float:
-        """Total USD spent on positions."""
-        return self.c_yes + self.c_no
-    
-    @property
-    def paired_quantity(self) -> float:
-        """Quantity of paired YES+NO positions (guaranteed $1 payout each)."""
-        return min(self.q_yes, self.q_no)
-    
+
+    # True when fills were recorded without a timestamp; updated_at is
+    # refreshed lazily via touch() instead of per-fill clock reads
+    _dirty: bool = field(default=False, init=False, repr=False)
+
+    # Derived values - pure functions of q_yes/c_yes/q_no/c_no, which only
+    # change in record_fill. Maintained there as plain attributes so hot
+    # readers pay one attribute load instead of a property dispatch.
+    mu_yes: float = field(default=0.0, init=False)  # VWAP (average cost) for YES
+    mu_no: float = field(default=0.0, init=False)  # VWAP (average cost) for NO
+    delta_q: float = field(default=0.0, init=False)  # ΔQ = Q_yes - Q_no
+    total_position: float = field(default=0.0, init=False)  # YES + NO tokens held
+    total_cost: float = field(default=0.0, init=False)  # Total USD spent
+    paired_quantity: float = field(default=0.0, init=False)  # min(Q_yes, Q_no)
+
+    def __post_init__(self):
+        self._recompute_derived()
+
+    def _recompute_derived(self):
+        """Refresh the derived fields after a position change."""
+        q_yes = self.q_yes
+        q_no = self.q_no
+        c_yes = self.c_yes
+        c_no = self.c_no
+        self.mu_yes = c_yes / q_yes if q_yes else 0.0
+        self.mu_no = c_no / q_no if q_no else 0.0
+        self.delta_q = q_yes - q_no
+        self.total_position = q_yes + q_no
+        self.total_cost = c_yes + c_no
+        self.paired_quantity = q_yes if q_yes < q_no else q_no
+    
+    def snapshot_pnl(self) -> tuple[float, float, float]:
+        """
+        Compute (paired_quantity, paired_cost, locked_profit) in one pass.
+
+        The three values share intermediates (paired quantity and the
+        per-side VWAPs), so computing them together avoids the chain of
+        property dispatches and repeated divisions.
+        """
+        q_yes = self.q_yes
+        q_no = self.q_no
+        paired = q_yes if q_yes < q_no else q_no
+        if paired == 0:
+            return 0.0, 0.0, 0.0
+        # Pro-rata cost from each side
+        yes_cost = (self.c_yes / q_yes) * paired if q_yes > 0 else 0.0
+        no_cost = (self.c_no / q_no) * paired if q_no > 0 else 0.0
+        paired_cost = yes_cost + no_cost
+        return paired, paired_cost, paired * 1.0 - paired_cost
+
     @property
     def paired_cost(self) -> float:
         """Cost basis for paired positions."""
-        paired = self.paired_quantity
-        if paired == 0:
-            return 0.0
-        # Pro-rata cost from each side
-        yes_cost = self.mu_yes * paired if self.q_yes > 0 else 0
-        no_cost = self.mu_no * paired if self.q_no > 0 else 0
-        return yes_cost + no_cost
-    
+        return self.snapshot_pnl()[1]
+
     @property
     def locked_profit(self) -> float:
         """
         Guaranteed profit from paired positions.
-        
+
         Each paired YES+NO = $1 at expiry.
         Locked profit = paired_quantity * $1 - paired_cost
         """
-        return self.paired_quantity * 1.0 - self.paired_cost
-    
+        return self.snapshot_pnl()[2]
+
     @property
     def unrealized_pnl(self) -> float:
         """
         Unrealized P&L = locked profit from pairs.
-        
+
         Note: Unpaired positions have uncertain value until expiry.
         """
-        return self.locked_profit
+        return self.snapshot_pnl()[2]
     
     @property
     def is_balanced(self) -> bool:
         """Check if inventory is approximately balanced."""
         return abs(self.delta_q) < 0.01
     
-    def record_fill(self, outcome: Outcome, side: Side, price: float, size: float):
+    def record_fill(
+        self,
+        outcome: Outcome,
+        side: Side,
+        price: float,
+        size: float,
+        now: Optional[datetime] = None,
+        log_fp=None,
+    ):
         """
         Record a fill and update inventory.
-        
+
         Args:
             outcome: YES or NO
             side: BUY or SELL
             price: Fill price
             size: Fill size (tokens)
+            now: Fill timestamp, if the caller already has it for this tick.
+                 When omitted, the clock read is deferred: updated_at is
+                 marked dirty and refreshed on the next touch().
+            log_fp: Optional open file to append a one-line fill record to
+                    (see append_fill / load with log_path).
         """
         self.total_trades += 1
         self.total_volume += price * size
-        self.updated_at = datetime.now()
+
+        if now is None and log_fp is not None:
+            now = datetime.now()  # The log record needs a concrete timestamp
+        if now is not None:
+            self.updated_at = now
+            self._dirty = False
+        else:
+            self._dirty = True
+
+        if log_fp is not None:
+            log_fp.write(orjson.dumps({
+                "outcome": outcome.value,
+                "side": side.value,
+                "price": price,
+                "size": size,
+                "ts": now,  # guaranteed set above whenever log_fp is given
+            }).decode() + "\n")
         
-        if outcome == Outcome.YES:
-            if side == Side.BUY:
-                # Buying YES: increase position and cost
-                self.c_yes += price * size
-                self.q_yes += size
-            else:  # SELL
-                # Selling YES: reduce position, realize P&L
-                if self.q_yes > 0:
-                    avg_cost = self.c_yes / self.q_yes
-                    sell_amount = min(size, self.q_yes)
-                    # P&L = (sell_price - avg_cost) * amount
-                    self.realized_pnl += (price - avg_cost) * sell_amount
-                    self.c_yes -= avg_cost * sell_amount
-                    self.q_yes = max(0, self.q_yes - size)
-        else:  # NO
-            if side == Side.BUY:
-                # Buying NO: increase position and cost
-                self.c_no += price * size
-                self.q_no += size
-            else:  # SELL
-                # Selling NO: reduce position, realize P&L
-                if self.q_no > 0:
-                    avg_cost = self.c_no / self.q_no
-                    sell_amount = min(size, self.q_no)
-                    self.realized_pnl += (price - avg_cost) * sell_amount
-                    self.c_no -= avg_cost * sell_amount
-                    self.q_no = max(0, self.q_no - size)
+        # Single update block: select the (quantity, cost) pair for the
+        # outcome up front instead of duplicating the math per side
+        is_yes = outcome is Outcome.YES
+        q = self.q_yes if is_yes else self.q_no
+        c = self.c_yes if is_yes else self.c_no
+
+        q, c, realized = _apply_fill(q, c, price, size, side is Side.BUY)
+        if realized:
+            self.realized_pnl += realized
+
+        if is_yes:
+            self.q_yes = q
+            self.c_yes = c
+        else:
+            self.q_no = q
+            self.c_no = c
+
+        self._recompute_derived()
     
+    def touch(self, now: Optional[datetime] = None):
+        """
+        Refresh updated_at once for any fills recorded without a timestamp.
+
+        Call this once per tick (or batch of fills) instead of paying a
+        clock read inside every record_fill.
+        """
+        if self._dirty or now is not None:
+            self.updated_at = now if now is not None else datetime.now()
+            self._dirty = False
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary for persistence."""
         return {
@@ -275,8 +494,9 @@ class InventoryState:
             "realized_pnl": self.realized_pnl,
             "total_trades": self.total_trades,
             "total_volume": self.total_volume,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            # orjson encodes datetimes as ISO-8601 natively
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
     
     @classmethod
@@ -290,46 +510,93 @@ class InventoryState:
             realized_pnl=data.get("realized_pnl", 0.0),
             total_trades=data.get("total_trades", 0),
             total_volume=data.get("total_volume", 0.0),
-            created_at=datetime.fromisoformat(data["created_at"]) if "created_at" in data else datetime.now(),
-            updated_at=datetime.fromisoformat(data["updated_at"]) if "updated_at" in data else datetime.now(),
+            created_at=_parse_ts(data["created_at"]) if "created_at" in data else datetime.now(),
+            updated_at=_parse_ts(data["updated_at"]) if "updated_at" in data else datetime.now(),
         )
     
     def save(self, filepath: str):
-        """Save state to JSON file."""
+        """
+        Save a full state snapshot to a JSON file.
+
+        Intended for periodic checkpoints (every K fills or T seconds);
+        per-fill persistence should go through the append-only fill log
+        (record_fill's log_fp) instead of rewriting this file.
+        """
+        if self._dirty:
+            # Fold deferred fill timestamps into the snapshot
+            self.touch()
         path = Path(filepath)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
-    
+        _ensure_parent(path)
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
+
     @classmethod
-    def load(cls, filepath: str) -> "InventoryState":
-        """Load state from JSON file."""
-        path = Path(filepath)
-        if not path.exists():
-            return cls()
-        with open(path, "r") as f:
-            data = json.load(f)
-        return cls.from_dict(data)
+    def load(cls, filepath: str, log_path: Optional[str] = None) -> "InventoryState":
+        """
+        Load state from a JSON snapshot file.
 
+        Args:
+            filepath: Snapshot file written by save().
+            log_path: Optional append-only fill log; fills recorded after
+                      the snapshot timestamp are replayed on top of it.
+        """
+        try:
+            with open(filepath, "rb") as f:
+                data = orjson.loads(f.read())
+        except FileNotFoundError:
+            state = cls()
+            # No snapshot - every logged fill must be replayed
+            snapshot_ts = datetime.min
+        else:
+            state = cls.from_dict(data)
+            snapshot_ts = state.updated_at
 
-@dataclass
+        if log_path is not None:
+            try:
+                with open(log_path, "r") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        rec = orjson.loads(line)
+                        ts = datetime.fromisoformat(rec["ts"])
+                        if ts <= snapshot_ts:
+                            continue  # Already folded into the snapshot
+                        state.record_fill(
+                            Outcome(rec["outcome"]),
+                            Side(rec["side"]),
+                            rec["price"],
+                            rec["size"],
+                            now=ts,
+                        )
+            except FileNotFoundError:
+                pass
+
+        return state
+
+
+@dataclass(slots=True)
 class StrategyState:
     """Overall strategy state."""
     mode: StrategyMode = StrategyMode.STOPPED
     inventory: InventoryState = field(default_factory=InventoryState)
     
+    # Per-side state indexed by Outcome, so code paths that handle both
+    # sides index a dict instead of branching on YES/NO field names
+
     # Active bid orders (we only place BUY orders as market maker)
-    bid_order_yes: Optional[LiveOrder] = None
-    bid_order_no: Optional[LiveOrder] = None
-    
+    bid_orders: Dict[Outcome, Optional[LiveOrder]] = field(
+        default_factory=lambda: {Outcome.YES: None, Outcome.NO: None})
+
     # Order books (updated continuously)
-    orderbook_yes: Optional[OrderBook] = None
-    orderbook_no: Optional[OrderBook] = None
-    
+    orderbooks: Dict[Outcome, Optional[OrderBook]] = field(
+        default_factory=lambda: {Outcome.YES: None, Outcome.NO: None})
+
     # Last quote prices (for detecting when to update)
-    last_bid_price_yes: Optional[float] = None
-    last_bid_price_no: Optional[float] = None
-    
+    last_bid_prices: Dict[Outcome, Optional[float]] = field(
+        default_factory=lambda: {Outcome.YES: None, Outcome.NO: None})
+
+
     # Timing
     started_at: Optional[datetime] = None
     last_quote_update: Optional[datetime] = None
@@ -342,8 +609,8 @@ class StrategyState:
         return {
             "mode": self.mode.value,
             "inventory": self.inventory.to_dict(),
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "market_expiry": self.market_expiry.isoformat() if self.market_expiry else None,
+            "started_at": self.started_at,
+            "market_expiry": self.market_expiry,
         }
     
     @classmethod
@@ -353,24 +620,24 @@ class StrategyState:
         state.mode = StrategyMode(data.get("mode", "STOPPED"))
         state.inventory = InventoryState.from_dict(data.get("inventory", {}))
         if data.get("started_at"):
-            state.started_at = datetime.fromisoformat(data["started_at"])
+            state.started_at = _parse_ts(data["started_at"])
         if data.get("market_expiry"):
-            state.market_expiry = datetime.fromisoformat(data["market_expiry"])
+            state.market_expiry = _parse_ts(data["market_expiry"])
         return state
     
     def save(self, filepath: str):
         """Save state to JSON file."""
         path = Path(filepath)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        _ensure_parent(path)
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
     
     @classmethod
     def load(cls, filepath: str) -> "StrategyState":
         """Load state from JSON file."""
-        path = Path(filepath)
-        if not path.exists():
+        try:
+            with open(filepath, "rb") as f:
+                data = orjson.loads(f.read())
+        except FileNotFoundError:
             return cls()
-        with open(path, "r") as f:
-            data = json.load(f)
         return cls.from_dict(data)
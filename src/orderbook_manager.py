@@ -5,15 +5,45 @@ Manages orderbook data fetching and caching for the strategy engine.
 """
 
 import asyncio
-from typing import Optional, Callable, Set, Dict, Any
+import os
+import time
+from pathlib import Path
+from typing import Optional, Callable, Dict, Any
 from datetime import datetime
 
+import orjson
+
 from config import Config, get_config
 from models import OrderBook, OrderBookLevel, Outcome
 from logger import get_logger
 
 logger = get_logger(__name__)
 
+# Tracked-order ids persisted per market on shutdown, so the next run
+# can batch-cancel leftovers without listing all open orders first
+_CACHE_DIR = Path.home() / ".cache" / "polymkt"
+
+
+def _tracked_ids_path(condition_id: str) -> Path:
+    return _CACHE_DIR / f"tracked_{condition_id}.json"
+
+
+def load_tracked_order_ids(condition_id: str) -> list[str]:
+    """Load order ids persisted by a previous session, if any."""
+    try:
+        data = orjson.loads(_tracked_ids_path(condition_id).read_bytes())
+        return [oid for oid in data if isinstance(oid, str)]
+    except (OSError, orjson.JSONDecodeError, TypeError):
+        return []
+
+
+def clear_tracked_order_ids(condition_id: str):
+    """Remove the persisted id file once the orders are dealt with."""
+    try:
+        _tracked_ids_path(condition_id).unlink(missing_ok=True)
+    except OSError:
+        pass
+
 
 class OrderBookManager:
     """
@@ -38,13 +68,39 @@ class OrderBookManager:
         # Order book cache
         self._book_yes: Optional[OrderBook] = None
         self._book_no: Optional[OrderBook] = None
+
+        # Top-of-book as plain floats, refreshed in update_book so readers
+        # get an attribute load instead of two property hops per price
+        self.best_bid_yes: Optional[float] = None
+        self.best_ask_yes: Optional[float] = None
+        self.best_bid_no: Optional[float] = None
+        self.best_ask_no: Optional[float] = None
+
+
+        # Track order IDs for fill detection. Published as an immutable
+        # snapshot: readers take one attribute load and can iterate
+        # without mutation hazards, writers pay a copy on each change
+        self._tracked_order_ids: frozenset[str] = frozenset()
         
-        # Track order IDs for fill detection
-        self._tracked_order_ids: Set[str] = set()
-        
-        # Stats
+        # Last top-of-book signature per outcome: polling often returns
+        # an identical snapshot, and those are dropped here before they
+        # bump stats or fire on_update
+        self._last_sig: Dict[Outcome, Optional[int]] = {
+            Outcome.YES: None,
+            Outcome.NO: None,
+        }
+
+        # Stats. Timestamps are plain ints/floats on the update path -
+        # monotonic for freshness, wall clock kept alongside and only
+        # formatted into an ISO string when stats are actually read
         self._fetch_count = 0
-        self._last_update: Optional[datetime] = None
+        self._suppressed_count = 0
+        self._last_update_ns: int = 0
+        self._last_update_wall: float = 0.0
+
+        # Stats snapshot, rebuilt only when a book updates; get_stats
+        # serves it as-is instead of rebuilding the nested dicts per call
+        self._stats_snapshot: Dict[str, Any] = self._build_stats()
     
     @property
     def book_yes(self) -> Optional[OrderBook]:
@@ -69,11 +125,37 @@ class OrderBookManager:
     
     def track_order(self, order_id: str):
         """Start tracking an order ID for fill detection."""
-        self._tracked_order_ids.add(order_id)
-    
+        self._tracked_order_ids = self._tracked_order_ids | {order_id}
+        self._persist_tracked()
+
     def untrack_order(self, order_id: str):
         """Stop tracking an order ID."""
-        self._tracked_order_ids.discard(order_id)
+        self._tracked_order_ids = self._tracked_order_ids - {order_id}
+        self._persist_tracked()
+
+    def _persist_tracked(self):
+        """
+        Write the tracked set through to disk on every change.
+
+        A crash then leaves an accurate file for the next startup's
+        batch cancel; an empty set removes the file. Each write is a
+        few dozen bytes next to the order placement round-trip that
+        triggered it, so the cost is noise. Best-effort.
+        """
+        condition_id = self.config.condition_id
+        if not condition_id:
+            return
+        if not self._tracked_order_ids:
+            clear_tracked_order_ids(condition_id)
+            return
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            path = _tracked_ids_path(condition_id)
+            tmp = path.with_suffix(".json.tmp")
+            tmp.write_bytes(orjson.dumps(sorted(self._tracked_order_ids)))
+            os.replace(tmp, path)
+        except OSError:
+            pass
     
     async def start(self):
         """Start the orderbook manager."""
@@ -82,33 +164,78 @@ class OrderBookManager:
         logger.info(f"   NO token: {self.config.token_id_no[:32]}...")
     
     async def stop(self):
-        """Stop the orderbook manager."""
+        """Stop the orderbook manager, persisting tracked order ids."""
+        self._persist_tracked()
         logger.info("OrderBookManager stopped")
     
-    def update_book(self, outcome: Outcome, book: OrderBook):
-        """Update the cached orderbook."""
+    def update_book(self, outcome: Outcome, book: OrderBook, is_delta: bool = False):
+        """
+        Update the cached orderbook and the top-of-book floats.
+
+        With is_delta=True, `book` carries only the changed levels and
+        they are folded into the cached book in place (no new object
+        graph per tick); without a cached book the payload is taken as
+        a full snapshot.
+        """
+        cached = self._book_yes if outcome == Outcome.YES else self._book_no
+        if is_delta and cached is not None:
+            cached.apply_delta(
+                bids=[(level.price, level.size) for level in book.bids],
+                asks=[(level.price, level.size) for level in book.asks],
+            )
+            book = cached
+
+        sig = book.top_signature()
+        if sig == self._last_sig[outcome]:
+            # Identical top-of-book - nothing downstream needs to react
+            self._suppressed_count += 1
+            return
+        self._last_sig[outcome] = sig
+
         if outcome == Outcome.YES:
             self._book_yes = book
+            self.best_bid_yes = book.best_bid
+            self.best_ask_yes = book.best_ask
         else:
             self._book_no = book
-        
+            self.best_bid_no = book.best_bid
+            self.best_ask_no = book.best_ask
+
         self._fetch_count += 1
-        self._last_update = datetime.now()
-    
+        self._last_update_ns = time.monotonic_ns()
+        self._last_update_wall = time.time()
+        self._stats_snapshot = self._build_stats()
+
+        if self.on_update:
+            self.on_update(outcome, book)
+
     def get_stats(self) -> Dict[str, Any]:
-        """Get statistics."""
+        """Get statistics (cached snapshot; treat as read-only)."""
+        # These change outside update_book, so refresh them here; the
+        # ISO timestamp is also built here rather than per update
+        self._stats_snapshot["tracked_orders"] = len(self._tracked_order_ids)
+        self._stats_snapshot["suppressed_count"] = self._suppressed_count
+        self._stats_snapshot["last_update"] = (
+            datetime.fromtimestamp(self._last_update_wall).isoformat()
+            if self._last_update_wall else None
+        )
+        return self._stats_snapshot
+
+    def _build_stats(self) -> Dict[str, Any]:
+        """Materialize the stats dict after a book update."""
         return {
             "has_data": self.has_data,
             "fetch_count": self._fetch_count,
-            "last_update": self._last_update.isoformat() if self._last_update else None,
+            "suppressed_count": self._suppressed_count,
+            "last_update": None,  # formatted lazily in get_stats
             "tracked_orders": len(self._tracked_order_ids),
             "yes_book": {
-                "best_bid": self._book_yes.best_bid if self._book_yes else None,
-                "best_ask": self._book_yes.best_ask if self._book_yes else None,
+                "best_bid": self.best_bid_yes,
+                "best_ask": self.best_ask_yes,
             } if self._book_yes else None,
             "no_book": {
-                "best_bid": self._book_no.best_bid if self._book_no else None,
-                "best_ask": self._book_no.best_ask if self._book_no else None,
+                "best_bid": self.best_bid_no,
+                "best_ask": self.best_ask_no,
             } if self._book_no else None,
         }
 
@@ -51,9 +51,9 @@ class PolymarketClient:
     def wallet_address(self) -> str:
         if self._clob:
             return self._clob.get_address()
-        # Derive from private key before client init
-        from eth_account import Account
-        return Account.from_key(self.config.private_key).address
+        # Derive from private key before client init (cached in config)
+        from config import _derive_address
+        return _derive_address(self.config.private_key)
     
     async def initialize(self):
         """Initialize the CLOB client and get API credentials."""
@@ -174,7 +174,7 @@ class PolymarketClient:
             raise RuntimeError("Client not initialized")
         
         # Map side to py-clob-client constants
-        clob_side = BUY if side == Side.BUY else SELL
+        clob_side = BUY if side is Side.BUY else SELL
         
         # Force exact 2 decimal precision using Decimal for precise rounding
         from decimal import Decimal, ROUND_HALF_UP
@@ -253,9 +253,9 @@ class PolymarketClient:
         
         # Default to worst-case price if not specified
         if price is None:
-            price = 0.99 if side == Side.BUY else 0.01
+            price = 0.99 if side is Side.BUY else 0.01
         
-        clob_side = BUY if side == Side.BUY else SELL
+        clob_side = BUY if side is Side.BUY else SELL
         
         # Force exact 2 decimal precision using Decimal for precise rounding
         from decimal import Decimal, ROUND_HALF_UP
@@ -337,6 +337,31 @@ class PolymarketClient:
             logger.error(f"Cancel error: {e}")
             return False
     
+    async def cancel_orders(self, order_ids: list[str]) -> set[str]:
+        """
+        Cancel a batch of orders in one HTTP round-trip.
+
+        Returns:
+            Set of order IDs confirmed cancelled (orders already matched
+            or already cancelled are reported by the API in not_canceled
+            and excluded here).
+        """
+        if not self._clob:
+            raise RuntimeError("Client not initialized")
+        if not order_ids:
+            return set()
+
+        try:
+            resp = await _run_sync(self._clob.cancel_orders, order_ids)
+            canceled = resp.get("canceled") or [] if isinstance(resp, dict) else []
+            not_canceled = resp.get("not_canceled") or {} if isinstance(resp, dict) else {}
+            for oid, reason in not_canceled.items():
+                logger.debug(f"Order {oid[:16]}... not cancelled: {reason}")
+            return set(canceled)
+        except Exception as e:
+            logger.error(f"Batch cancel error: {e}")
+            return set()
+
     async def cancel_all_orders(self, token_id: Optional[str] = None) -> int:
         """
         Cancel all orders, optionally filtered by token.
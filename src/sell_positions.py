@@ -13,7 +13,12 @@ Usage:
 import asyncio
 import argparse
 import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
 import httpx
+import orjson
 from dotenv import load_dotenv
 from eth_account import Account
 
@@ -26,85 +31,270 @@ from py_clob_client.order_builder.constants import BUY, SELL
 DATA_API = "https://data-api.polymarket.com"
 CLOB_HOST = "https://clob.polymarket.com"
 
+# Cap on concurrent sell submissions (stay under CLOB rate limits)
+SELL_CONCURRENCY = 8
+
+# Positions pages fetched concurrently per window
+PAGE_WINDOW = 4
+
+# Short-lived positions cache: repeated runs (dry-run then real run)
+# within the TTL skip the Data API entirely
+CACHE_DIR = Path.home() / ".cache" / "polymkt"
+POSITIONS_CACHE_TTL = 30.0  # seconds
+
+# Shared HTTP client, lazily built: one TLS/H2 handshake per run
+# regardless of how many fetches happen
+_client: httpx.AsyncClient = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get the shared AsyncClient, building it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=30,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=16, keepalive_expiry=30),
+        )
+    return _client
+
+
+async def _close_client():
+    """Close the shared AsyncClient if it was built."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+@dataclass(slots=True)
+class SellCandidate:
+    """One sellable position with its display fields parsed once."""
+    title: str
+    outcome: str
+    size: float
+    cur_price: float
+    value: float
+    token_id: str
+
+
+async def _ainput(prompt: str) -> str:
+    """Blocking input() in a worker thread so the loop keeps running."""
+    return await asyncio.get_running_loop().run_in_executor(None, input, prompt)
+
 
 async def get_all_positions(wallet_address: str) -> list:
     """
     Get all positions for wallet from Polymarket Data API.
-    Uses pagination to ensure all positions are retrieved.
+
+    Pages are fetched in concurrent windows of PAGE_WINDOW requests
+    (multiplexed over one HTTP/2 connection) instead of one serial
+    round-trip per page; a short or empty page ends the scan.
     """
     all_data = []
     offset = 0
     limit = 1000  # Max per request
-    
-    async with httpx.AsyncClient(timeout=30) as client:
-        while True:
-            url = f"{DATA_API}/positions?user={wallet_address}&limit={limit}&offset={offset}"
-            
+
+    client = _get_client()
+
+    # Warm up the connection so the first page window multiplexes over
+    # an already-open stream instead of racing the handshake
+    try:
+        await client.get(f"{DATA_API}/")
+    except httpx.HTTPError:
+        pass
+
+    while True:
+        page_offsets = [offset + i * limit for i in range(PAGE_WINDOW)]
+        responses = await asyncio.gather(
+            *[
+                client.get(f"{DATA_API}/positions?user={wallet_address}&limit={limit}&offset={o}")
+                for o in page_offsets
+            ],
+            return_exceptions=True,
+        )
+
+        done = False
+        for page_offset, resp in zip(page_offsets, responses):
             try:
-                resp = await client.get(url)
+                if isinstance(resp, BaseException):
+                    raise resp
                 resp.raise_for_status()
                 data = resp.json()
             except Exception as e:
-                print(f"❌ Error fetching positions at offset {offset}: {e}")
-                break
-            
+                print(f"❌ Error fetching positions at offset {page_offset}: {e}")
+                return all_data
+
             if not data:
+                done = True
                 break
-                
+
             all_data.extend(data)
             print(f"   Fetched {len(data)} positions (total: {len(all_data)})")
-            
+
             if len(data) < limit:
+                done = True
                 break
-                
-            offset += limit
-    
+
+        if done:
+            break
+
+        offset += limit * PAGE_WINDOW
+
     return all_data
 
 
-def create_clob_client(private_key: str):
-    """Create and initialize CLOB client."""
+async def get_positions_cached(wallet_address: str, ttl: float = POSITIONS_CACHE_TTL) -> list:
+    """
+    Get positions for wallet, served from a short-TTL file cache.
+
+    A cache file younger than ttl is returned without touching the
+    network; otherwise the Data API is fetched and the result written
+    atomically for the next run.
+    """
+    path = CACHE_DIR / f"positions_{wallet_address.lower()}.json"
+
+    try:
+        age = time.time() - path.stat().st_mtime
+        if 0 <= age < ttl:
+            with open(path, "rb") as f:
+                data = orjson.loads(f.read())
+            print(f"   Using cached positions ({age:.0f}s old)")
+            return data
+    except (OSError, orjson.JSONDecodeError):
+        pass  # Missing, stale, or corrupt cache - fetch fresh
+
+    positions = await get_all_positions(wallet_address)
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_bytes(orjson.dumps(positions))
+        os.replace(tmp, path)
+    except OSError:
+        pass  # Cache write failure is not worth failing the run
+
+    return positions
+
+
+def _load_cached_creds(wallet_address: str):
+    """Load cached ApiCreds for wallet, or None if missing/corrupt."""
+    path = CACHE_DIR / f"creds_{wallet_address.lower()}.json"
+    try:
+        data = orjson.loads(path.read_bytes())
+        return ApiCreds(
+            api_key=data["api_key"],
+            api_secret=data["api_secret"],
+            api_passphrase=data["api_passphrase"],
+        )
+    except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+        return None
+
+
+def _clear_cached_creds(wallet_address: str):
+    """Remove cached ApiCreds, e.g. after the server rejects them."""
+    try:
+        (CACHE_DIR / f"creds_{wallet_address.lower()}.json").unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def _save_cached_creds(wallet_address: str, creds):
+    """Write ApiCreds to the cache with owner-only permissions."""
+    path = CACHE_DIR / f"creds_{wallet_address.lower()}.json"
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_bytes(orjson.dumps({
+            "api_key": creds.api_key,
+            "api_secret": creds.api_secret,
+            "api_passphrase": creds.api_passphrase,
+        }))
+        os.chmod(tmp, 0o600)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # Cache write failure is not worth failing the run
+
+
+def create_clob_client(private_key: str, use_cache: bool = True):
+    """
+    Create and initialize CLOB client.
+
+    API creds derived from the private key are cached on disk (0600),
+    so repeat runs skip the derive round-trip entirely; a missing or
+    corrupt cache falls back to the derive/create dance and refills it.
+    Pass use_cache=False to force a fresh derivation (e.g. after the
+    server rejected cached creds).
+
+    Returns (client, wallet_address, creds_from_cache).
+    """
     account = Account.from_key(private_key)
-    
+
     # Create client
     client = ClobClient(
         host=CLOB_HOST,
         chain_id=POLYGON,
         key=private_key,
     )
-    
-    # Derive API key
-    try:
-        creds = client.derive_api_key()
-        client.set_api_creds(creds)
-    except Exception:
-        # Try to create new API key
-        creds = client.create_api_key()
-        client.set_api_creds(creds)
-    
-    return client, account.address
+
+    creds = _load_cached_creds(account.address) if use_cache else None
+    creds_from_cache = creds is not None
+    if creds is None:
+        # Derive API key (create a new one if derivation fails)
+        try:
+            creds = client.derive_api_key()
+        except Exception:
+            creds = client.create_api_key()
+        _save_cached_creds(account.address, creds)
+
+    client.set_api_creds(creds)
+    return client, account.address, creds_from_cache
 
 
-async def sell_token(clob_client, token_id: str, size: float):
+def _is_auth_error(result) -> bool:
+    """Heuristic: did a sell fail because the API rejected our creds?"""
+    if isinstance(result, BaseException):
+        msg = str(result)
+    elif isinstance(result, tuple) and not result[0]:
+        msg = result[1]
+    else:
+        return False
+    msg = msg.lower()
+    return "401" in msg or "unauthorized" in msg or "invalid api key" in msg
+
+
+async def sell_token(clob_client, token_id: str, size: float,
+                     semaphore: asyncio.Semaphore = None):
     """
     Sell tokens using FAK order.
+
+    The CLOB client is synchronous, so the sign-and-post runs in a
+    worker thread; pass a semaphore to bound how many submissions are
+    in flight when calling this concurrently.
     """
     from py_clob_client.clob_types import OrderArgs, OrderType
-    
-    # Round size to 2 decimals
-    clean_size = int(size * 100 + 0.5) / 100
-    
+
+    # Round size to 2 decimals via integer ticks (exact, no +0.5 bias)
+    clean_size = round(size * 100) / 100
+
     order_args = OrderArgs(
         token_id=token_id,
         side=SELL,
         price=0.01,  # Worst case price - will fill at actual bid
         size=clean_size,
     )
-    
-    try:
+
+    def _submit():
         signed_order = clob_client.create_order(order_args)
-        resp = clob_client.post_order(signed_order, OrderType.FAK)
-        
+        return clob_client.post_order(signed_order, OrderType.FAK)
+
+    try:
+        if semaphore is not None:
+            async with semaphore:
+                resp = await asyncio.to_thread(_submit)
+        else:
+            resp = await asyncio.to_thread(_submit)
+
         if resp.get("success"):
             order_id = resp.get("orderID", "")[:16]
             return True, f"Order submitted: {order_id}..."
@@ -137,32 +327,41 @@ async def main():
     
     # Initialize CLOB client
     print("\n🔑 Initializing client...")
-    clob_client, wallet_address = create_clob_client(private_key)
+    clob_client, wallet_address, creds_from_cache = create_clob_client(private_key)
     print(f"   Wallet: {wallet_address[:10]}...{wallet_address[-6:]}")
     
     # Fetch all positions
     print("\n📦 Fetching all positions...")
-    positions = await get_all_positions(wallet_address)
-    
-    # Filter to SELLABLE positions:
-    # - Must have balance > 0
-    # - Must NOT be redeemable (resolved markets can't be sold on CLOB)
-    # - Should have some value (curPrice > 0)
-    sellable_positions = [
-        p for p in positions 
-        if float(p.get("size", 0)) > 0.01 
-        and not p.get("redeemable", False)
-    ]
-    
-    # Also track resolved positions for info
-    resolved_positions = [
-        p for p in positions 
-        if float(p.get("size", 0)) > 0.01 
-        and p.get("redeemable", False)
-    ]
+    positions = await get_positions_cached(wallet_address)
     
+    # Partition in a single pass:
+    # - SELLABLE: balance > 0 and NOT redeemable (resolved markets
+    #   can't be sold on CLOB), parsed once into SellCandidate so the
+    #   display and sell loops below never touch the raw dicts again
+    # - RESOLVED: redeemable, tracked for info with value accumulated
+    #   inline
+    sellable_positions = []
+    resolved_positions = []
+    resolved_value = 0.0
+    for p in positions:
+        size = float(p.get("size", 0))
+        if size <= 0.01:
+            continue
+        cur_price = float(p.get("curPrice", 0))
+        if p.get("redeemable", False):
+            resolved_positions.append(p)
+            resolved_value += size * cur_price
+        else:
+            sellable_positions.append(SellCandidate(
+                title=p.get("title", "Unknown")[:50],
+                outcome=p.get("outcome", "?"),
+                size=size,
+                cur_price=cur_price,
+                value=size * cur_price,
+                token_id=p.get("asset", ""),
+            ))
+
     if resolved_positions:
-        resolved_value = sum(float(p.get("size", 0)) * float(p.get("curPrice", 0)) for p in resolved_positions)
         print(f"\n⚠️  {len(resolved_positions)} positions are RESOLVED (can't sell, use redeem_positions.py)")
         print(f"   Resolved positions value: ${resolved_value:.2f}")
     
@@ -179,15 +378,10 @@ async def main():
     # Display positions
     total_value = 0
     for i, pos in enumerate(active_positions):
-        title = pos.get("title", "Unknown")[:50]
-        outcome = pos.get("outcome", "?")
-        size = float(pos.get("size", 0))
-        cur_price = float(pos.get("curPrice", 0))
-        value = size * cur_price
-        total_value += value
-        
-        print(f"  [{i+1}] {title}...")
-        print(f"      {outcome}: {size:.2f} tokens @ ${cur_price:.2f} = ${value:.2f}")
+        total_value += pos.value
+
+        print(f"  [{i+1}] {pos.title}...")
+        print(f"      {pos.outcome}: {pos.size:.2f} tokens @ ${pos.cur_price:.2f} = ${pos.value:.2f}")
         print()
     
     print(f"   💰 Total estimated value: ${total_value:.2f}")
@@ -204,7 +398,7 @@ async def main():
         print(f"Selling ALL {len(to_sell)} positions...")
     else:
         print("Enter position numbers to sell (comma-separated), 'all', or 'q' to quit:")
-        response = input("> ").strip().lower()
+        response = (await _ainput("> ")).strip().lower()
         
         if response in ('q', 'quit', ''):
             print("❌ Cancelled")
@@ -226,7 +420,7 @@ async def main():
     
     # Confirm
     print(f"\n⚠️  About to sell {len(to_sell)} position(s)")
-    confirm = input("Proceed? [y/N]: ").strip().lower()
+    confirm = (await _ainput("Proceed? [y/N]: ")).strip().lower()
     if confirm not in ('y', 'yes'):
         print("❌ Cancelled")
         return
@@ -236,25 +430,58 @@ async def main():
     print("🚀 EXECUTING SELLS")
     print("=" * 70)
     
-    for pos in to_sell:
-        title = pos.get("title", "Unknown")[:40]
-        outcome = pos.get("outcome", "?")
-        size = float(pos.get("size", 0))
-        token_id = pos.get("asset", "")
-        
-        print(f"\n📤 Selling {size:.2f} {outcome} ({title}...)")
-        
-        success, message = await sell_token(clob_client, token_id, size)
-        
-        if success:
-            print(f"   ✅ {message}")
+    # Submit concurrently (bounded by the semaphore) so N positions
+    # cost ~1 round-trip of wall clock instead of N, then report in
+    # input order
+    semaphore = asyncio.Semaphore(SELL_CONCURRENCY)
+    results = await asyncio.gather(
+        *[
+            sell_token(clob_client, pos.token_id, pos.size, semaphore)
+            for pos in to_sell
+        ],
+        return_exceptions=True,
+    )
+
+    # Cached creds can go stale if the server-side key was rotated or
+    # revoked. On auth failures, drop the cache, re-derive fresh creds,
+    # and retry just the rejected sells once
+    if creds_from_cache and any(_is_auth_error(r) for r in results):
+        print(f"\n⚠️  Cached API creds rejected - re-deriving and retrying...")
+        _clear_cached_creds(wallet_address)
+        clob_client, wallet_address, _ = create_clob_client(private_key, use_cache=False)
+        retry_idx = [i for i, r in enumerate(results) if _is_auth_error(r)]
+        retried = await asyncio.gather(
+            *[
+                sell_token(clob_client, to_sell[i].token_id, to_sell[i].size, semaphore)
+                for i in retry_idx
+            ],
+            return_exceptions=True,
+        )
+        for i, r in zip(retry_idx, retried):
+            results[i] = r
+
+    for pos, result in zip(to_sell, results):
+        print(f"\n📤 Selling {pos.size:.2f} {pos.outcome} ({pos.title[:40]}...)")
+
+        if isinstance(result, BaseException):
+            print(f"   ⚠️ Error: {result}")
+        elif result[0]:
+            print(f"   ✅ {result[1]}")
         else:
-            print(f"   ⚠️ {message}")
-    
+            print(f"   ⚠️ {result[1]}")
+
     print("\n✅ Done!")
 
 
+async def _run():
+    """Run main and close the shared HTTP client on the way out."""
+    try:
+        await main()
+    finally:
+        await _close_client()
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(_run())
 
 
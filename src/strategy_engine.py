@@ -10,7 +10,9 @@ Implements the Join-or-Improve strategy:
 """
 
 import asyncio
+import logging
 import time
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
@@ -22,6 +24,10 @@ from models import (
     Outcome,
     Side,
     OrderBook,
+    Price,
+    PRICE_SCALE,
+    price_to_ticks,
+    ticks_to_price,
 )
 from polymarket_client import PolymarketClient, get_client
 from orderbook_manager import OrderBookManager, get_orderbook_manager
@@ -30,6 +36,85 @@ logger = get_logger(__name__)
 
 # Constants
 TICK_SIZE = 0.01  # Polymarket minimum price increment
+OUTCOMES = (Outcome.YES, Outcome.NO)
+OPPOSITE = {Outcome.YES: Outcome.NO, Outcome.NO: Outcome.YES}
+
+
+@dataclass(slots=True)
+class OrderMeta:
+    """Per-order bookkeeping: one dict entry instead of parallel structures."""
+    outcome: Outcome
+    pending_cancel: bool = False
+
+
+@dataclass(slots=True)
+class FillEvent:
+    """A fill as reported by the user-channel WebSocket."""
+    order_id: str
+    outcome: Outcome
+    price: float
+    size: float
+
+
+def _calc_bid_ticks(bid_t: Price, ask_t: Price, skew_t: int, cap_t: Price) -> Price:
+    """
+    Join-or-Improve bid calculation in pure integer ticks.
+
+    Module-level, pure int-in/int-out (no self, no logging) so it could
+    be handed to a JIT compiler unchanged. Returns -1 when the book is
+    crossed and -2 when the bid would exceed the profitability cap; the
+    caller owns any logging for those sentinels.
+    """
+    # Improve by one tick when the spread allows, else join
+    raw_t = bid_t + 1 if ask_t - bid_t > 1 else bid_t
+
+    # Apply inventory skew and clamp to the valid price range
+    adjusted_t = raw_t - skew_t
+    adjusted_t = max(1, min(99, adjusted_t))
+
+    # Ensure we don't cross the book
+    if adjusted_t >= ask_t:
+        adjusted_t = bid_t
+        if adjusted_t >= ask_t:
+            return -1
+
+    # Profitability cap
+    if adjusted_t > cap_t:
+        return -2
+
+    return adjusted_t
+
+
+class TokenBucket:
+    """
+    Async token-bucket rate limiter for order placement/cancellation.
+
+    Unlike a fixed inter-call sleep, acquire() returns immediately while
+    the bucket has budget and only sleeps for the exact refill time when
+    it is empty - bursty quote cycles pay no pacing cost until they
+    actually approach the rate cap.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1.0):
+        """Take tokens from the bucket, sleeping only if it is empty."""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return
+            needed = (tokens - self._tokens) / self.rate
+            self._tokens = 0.0
+            await asyncio.sleep(needed)
+            self._last = time.monotonic()
 
 
 class StrategyEngine:
@@ -40,6 +125,27 @@ class StrategyEngine:
     at or near the top of the book to capture fills.
     """
 
+    # Fixed attribute layout: no instance __dict__, faster lookups for
+    # the self.* reads the quote cycle does dozens of times per tick
+    __slots__ = (
+        "config",
+        "client",
+        "ob_manager",
+        "state",
+        "_loop",
+        "_running",
+        "_main_task",
+        "_fill_queue",
+        "_fill_task",
+        "_side_locks",
+        "_throttle",
+        "_halt_new_orders",
+        "_orders",
+        "_last_status_log_ts",
+        "_last_skip_log_ns",
+        "_last_inputs_hash",
+    )
+
     def __init__(
         self,
         config: Optional[Config] = None,
@@ -50,27 +156,44 @@ class StrategyEngine:
         self.client = client
         self.ob_manager = ob_manager
         self.state = StrategyState()
-        self._lock = asyncio.Lock()
         self._loop = None
         self._running = False
-        
-        # Guards against duplicate order placement
-        self._placing_yes = False
-        self._placing_no = False
+        self._main_task: Optional[asyncio.Task] = None
+
+        # Fill pipeline: the WS thread enqueues, a single consumer task
+        # applies events in batches on the event loop
+        self._fill_queue: asyncio.Queue[FillEvent] = asyncio.Queue()
+        self._fill_task: Optional[asyncio.Task] = None
+
+        # Per-side locks guarding order placement: _update_bid early-exits
+        # when a side is busy instead of queueing behind it
+        self._side_locks: dict[Outcome, asyncio.Lock] = {
+            Outcome.YES: asyncio.Lock(),
+            Outcome.NO: asyncio.Lock(),
+        }
+
+        # Shared rate budget for order placements and cancels
+        self._throttle = TokenBucket(
+            rate=self.config.max_orders_per_sec,
+            capacity=self.config.max_orders_per_sec,
+        )
         # Halt flag to block any new placements immediately
         self._halt_new_orders = False
         
-        # Track order outcomes for fill handling
-        self._order_outcome: dict[str, Outcome] = {}
+        # Per-order metadata (outcome for fill handling, pending-cancel
+        # flag), one dict so each event resolves with a single lookup
+        self._orders: dict[str, OrderMeta] = {}
 
-        # Orders we attempted to cancel but haven't confirmed as cancelled/filled yet
-        self._pending_cancel: set[str] = set()
-        
-        # Last status log time (for periodic logging)
-        self._last_status_log: Optional[datetime] = None
-        
-        # Throttle for "skipping bid" log messages
-        self._last_skip_log_time: float = 0.0
+
+        # Last status log time (monotonic, for periodic logging)
+        self._last_status_log_ts: float = 0.0
+
+        # Throttle for "skipping bid" log messages (monotonic ns)
+        self._last_skip_log_ns: int = 0
+
+        # Hash of the last quote-cycle inputs; unchanged inputs mean the
+        # whole cycle would be a no-op, so _update_quotes skips it
+        self._last_inputs_hash: Optional[int] = None
 
     async def start(self):
         """Start the strategy engine."""
@@ -78,9 +201,8 @@ class StrategyEngine:
         self._running = True
         # Reset placement guards when starting
         self._halt_new_orders = False
-        self._placing_yes = False
-        self._placing_no = False
-        self._pending_cancel.clear()
+        for meta in self._orders.values():
+            meta.pending_cancel = False
         
         if self.client is None:
             self.client = await get_client()
@@ -97,8 +219,11 @@ class StrategyEngine:
         logger.info(f"   Order size: {self.config.order_size}")
         logger.info(f"   Refresh interval: {self.config.refresh_interval}s")
         
-        # Start the main loop
-        asyncio.create_task(self._main_loop())
+        # Start the main loop and the fill consumer, holding the
+        # references so the tasks can't be garbage-collected mid-flight
+        # and stop() can cancel them cleanly
+        self._main_task = asyncio.create_task(self._main_loop(), name="mm_main_loop")
+        self._fill_task = asyncio.create_task(self._fill_consumer(), name="mm_fill_consumer")
 
     async def _main_loop(self):
         """
@@ -106,7 +231,7 @@ class StrategyEngine:
         """
         logger.info(f"📊 Starting main loop (interval: {self.config.refresh_interval}s)")
         
-        while self._running and self.state.mode != StrategyMode.STOPPED:
+        while self._running and self.state.mode is not StrategyMode.STOPPED:
             try:
                 # Wait for next iteration
                 await asyncio.sleep(self.config.refresh_interval)
@@ -127,23 +252,24 @@ class StrategyEngine:
                 await asyncio.sleep(5)
 
     async def _refresh_orderbooks(self):
-        """Fetch fresh orderbook data from API."""
-        try:
-            # Fetch YES orderbook
-            yes_book = await self.client.get_orderbook(self.config.token_id_yes)
-            if yes_book:
-                self.state.orderbook_yes = yes_book
-            
-            # Rate limiting between API calls
-            await asyncio.sleep(0.5)
-            
-            # Fetch NO orderbook
-            no_book = await self.client.get_orderbook(self.config.token_id_no)
-            if no_book:
-                self.state.orderbook_no = no_book
-                
-        except Exception as e:
-            logger.error(f"Error fetching orderbooks: {e}")
+        """Fetch fresh orderbook data from API, both sides concurrently."""
+        # Fetching YES and NO in parallel halves the wall-clock cost of the
+        # refresh (one HTTP RTT instead of two plus a courtesy sleep)
+        yes_book, no_book = await asyncio.gather(
+            self.client.get_orderbook(self.config.token_id_yes),
+            self.client.get_orderbook(self.config.token_id_no),
+            return_exceptions=True,
+        )
+
+        if isinstance(yes_book, BaseException):
+            logger.error(f"Error fetching YES orderbook: {yes_book}")
+        elif yes_book:
+            self.state.orderbooks[Outcome.YES] = yes_book
+
+        if isinstance(no_book, BaseException):
+            logger.error(f"Error fetching NO orderbook: {no_book}")
+        elif no_book:
+            self.state.orderbooks[Outcome.NO] = no_book
 
     async def stop(self, sell_tokens: bool = False):
         """
@@ -155,10 +281,27 @@ class StrategyEngine:
         """
         logger.info("🛑 Stopping strategy engine...")
         self._running = False
+        # _update_bid checks this flag at entry and again before placing,
+        # so no new orders can sneak out while we tear down
         self._halt_new_orders = True
-        self._placing_yes = True
-        self._placing_no = True
-        
+
+        # Tear down the main loop deterministically before cancelling
+        # orders, so no quote cycle races the cleanup below
+        if self._main_task is not None:
+            self._main_task.cancel()
+            await asyncio.gather(self._main_task, return_exceptions=True)
+            self._main_task = None
+
+        # Apply any fills still queued before the books close, then stop
+        # the consumer
+        if self._fill_task is not None:
+            if not self._fill_queue.empty():
+                self._apply_fills(self._drain_fill_queue())
+            self._fill_task.cancel()
+            await asyncio.gather(self._fill_task, return_exceptions=True)
+            self._fill_task = None
+
+
         # Cancel all orders
         await self.cancel_all_orders()
         
@@ -183,27 +326,27 @@ class StrategyEngine:
 
             # Then attempt per-order cancel for any still tracked
             active_ids = set()
-            if self.state.bid_order_yes and self.state.bid_order_yes.is_active:
-                active_ids.add(self.state.bid_order_yes.order_id)
-            if self.state.bid_order_no and self.state.bid_order_no.is_active:
-                active_ids.add(self.state.bid_order_no.order_id)
-            active_ids.update(getattr(self, "_order_outcome", {}).keys())
-
+            for order in self.state.bid_orders.values():
+                if order and order.is_active:
+                    active_ids.add(order.order_id)
+            active_ids.update(self._orders.keys())
+
+            if active_ids:
+                # Single bulk round-trip instead of one RTT per order
+                confirmed = await self.client.cancel_orders(list(active_ids))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"   Batch-cancelled {len(confirmed)}/{len(active_ids)} tracked orders")
+
+            # Nothing is resting after the sweep, so drop the ids from
+            # fill tracking too - on clean shutdown the manager then
+            # persists an empty set instead of just-cancelled ids
             for oid in active_ids:
-                try:
-                    await self.client.cancel_order(oid)
-                    logger.debug(f"   Cancelled order {oid[:8]}...")
-                except Exception as ce:
-                    logger.debug(f"   Order {oid[:8]} already gone or cannot cancel: {ce}")
+                self._untrack_order(oid)
 
             # Clear local order references
-            self._pending_cancel.clear()
-            self.state.bid_order_yes = None
-            self.state.bid_order_no = None
-            self.state.last_bid_price_yes = None
-            self.state.last_bid_price_no = None
-            self._placing_yes = False
-            self._placing_no = False
+            for oc in OUTCOMES:
+                self.state.bid_orders[oc] = None
+                self.state.last_bid_prices[oc] = None
         except Exception as e:
             logger.error(f"   Error cancelling orders: {e}")
 
@@ -263,11 +406,11 @@ class StrategyEngine:
 
     def _remember_order(self, order_id: str, outcome: Outcome):
         """Remember which outcome an order is for."""
-        self._order_outcome[order_id] = outcome
+        self._orders[order_id] = OrderMeta(outcome)
 
     def _forget_order(self, order_id: str):
         """Forget order metadata."""
-        self._order_outcome.pop(order_id, None)
+        self._orders.pop(order_id, None)
 
     def _track_order(self, order_id: str):
         """Track an order for fill detection."""
@@ -282,40 +425,47 @@ class StrategyEngine:
 
     async def _log_status(self):
         """Log status information periodically."""
-        now = datetime.now()
-        if self._last_status_log and (now - self._last_status_log).total_seconds() < 10:
+        # Monotonic gate: a float subtraction on the early-return path
+        # instead of datetime/timedelta allocations, immune to wall-clock
+        # jumps
+        now_mono = time.monotonic()
+        if now_mono - self._last_status_log_ts < 10.0:
             return
-        
-        self._last_status_log = now
+        self._last_status_log_ts = now_mono
+
+        # Single wall-clock read per status tick, shared by everything
+        # below that needs a datetime
+        now = datetime.now()
         inv = self.state.inventory
-        yes_book = self.state.orderbook_yes
-        no_book = self.state.orderbook_no
-        
+        yes_book = self.state.orderbooks[Outcome.YES]
+        no_book = self.state.orderbooks[Outcome.NO]
+
         # Market state
         if yes_book and no_book and yes_book.best_bid and yes_book.best_ask and no_book.best_bid and no_book.best_ask:
-            logger.info(f"📈 Market: YES {yes_book.best_bid:.2f}/{yes_book.best_ask:.2f} | NO {no_book.best_bid:.2f}/{no_book.best_ask:.2f}")
+            market_line = f"📈 Market: YES {yes_book.best_bid:.2f}/{yes_book.best_ask:.2f} | NO {no_book.best_bid:.2f}/{no_book.best_ask:.2f}"
         else:
-            logger.info("📈 Market: Waiting for orderbook data...")
-        
+            market_line = "📈 Market: Waiting for orderbook data..."
+
         # Inventory state
         skew = self.config.compute_skew(inv.delta_q)
-        logger.info(f"📦 Inventory: ΔQ={inv.delta_q:.2f} | Skew=${skew:+.3f} | YES={inv.q_yes:.2f} | NO={inv.q_no:.2f}")
-        logger.info(f"💰 P&L: Locked=${inv.locked_profit:.4f} | Pairs={inv.paired_quantity:.2f} | Trades={inv.total_trades}")
-        
+
         # Active orders
-        if self.state.bid_order_yes:
-            yes_order_info = f"YES@{self.state.bid_order_yes.price:.2f}"
-        else:
-            yes_order_info = "None"
-        if self.state.bid_order_no:
-            no_order_info = f"NO@{self.state.bid_order_no.price:.2f}"
-        else:
-            no_order_info = "None"
-        logger.info(f"📋 Bids: {yes_order_info} | {no_order_info}")
-        
-        # Mode and timing
-        time_left = self.config.time_until_expiry().total_seconds()
-        logger.info(f"⏱️  Expiry in {time_left:.0f}s | Mode: {self.state.mode.value}")
+        order_infos = [
+            f"{oc.value}@{order.price:.2f}" if (order := self.state.bid_orders[oc]) else "None"
+            for oc in OUTCOMES
+        ]
+
+        # Mode and timing (reuse the tick's datetime instead of re-reading the clock)
+        time_left = self.config.time_until_expiry(now).total_seconds()
+
+        # Single multi-line record: one pass through the logging machinery
+        logger.info("\n".join([
+            market_line,
+            f"📦 Inventory: ΔQ={inv.delta_q:.2f} | Skew=${skew:+.3f} | YES={inv.q_yes:.2f} | NO={inv.q_no:.2f}",
+            f"💰 P&L: Locked=${inv.locked_profit:.4f} | Pairs={inv.paired_quantity:.2f} | Trades={inv.total_trades}",
+            f"📋 Bids: {order_infos[0]} | {order_infos[1]}",
+            f"⏱️  Expiry in {time_left:.0f}s | Mode: {self.state.mode.value}",
+        ]))
 
     async def _update_quotes(self):
         """
@@ -327,274 +477,337 @@ class StrategyEngine:
         3. Apply inventory skew to both prices
         4. Skip bidding on a side if inventory is too skewed
         """
-        if self.state.mode == StrategyMode.STOPPED or self._halt_new_orders:
+        if self.state.mode is StrategyMode.STOPPED or self._halt_new_orders:
             return
         
         inv = self.state.inventory
-        yes_book = self.state.orderbook_yes
-        no_book = self.state.orderbook_no
-        
-        if not yes_book or not no_book:
+        books = self.state.orderbooks
+
+        if not books[Outcome.YES] or not books[Outcome.NO]:
             return
-        
-        # Calculate inventory skew
-        skew = self.config.compute_skew(inv.delta_q)
-        
+
+        # Bind config values once per cycle instead of re-walking the
+        # attribute chains per side
+        cfg = self.config
+        delta_q = inv.delta_q
+
+        # The quote decision depends only on the two tops-of-book and our
+        # inventory; if none of them moved since the last cycle, every
+        # price below would come out identical and the near-equal check
+        # in _update_bid would drop it anyway. Skip the whole cycle.
+        yes_book = books[Outcome.YES]
+        no_book = books[Outcome.NO]
+        inputs_hash = hash((
+            yes_book.best_bid, yes_book.best_ask,
+            no_book.best_bid, no_book.best_ask,
+            round(delta_q * 100),
+        ))
+        if inputs_hash == self._last_inputs_hash:
+            return
+        self._last_inputs_hash = inputs_hash
+
+        # Calculate inventory skew, converted to integer ticks once per
+        # cycle (the bid math below runs entirely in tick space)
+        skew = cfg.compute_skew(delta_q)
+        skew_ticks = price_to_ticks(skew)
+
+        # Order size only depends on delta_q, so both sides share one lookup
+        order_size = cfg.get_order_size(delta_q)
+
         # Normal quoting mode - bid on both sides with skew adjustment
-        if self.state.mode != StrategyMode.QUOTING:
+        if self.state.mode is not StrategyMode.QUOTING:
             logger.info(f"✅ Resuming normal quoting")
             self.state.mode = StrategyMode.QUOTING
-        should_bid_yes = True
-        should_bid_no = True
-        
-        # Calculate YES bid price
-        yes_bid_price = None
-        if should_bid_yes and yes_book.best_bid is not None and yes_book.best_ask is not None:
-            no_best_bid = no_book.best_bid if no_book.best_bid is not None else 0.50
-            no_avg_cost = inv.mu_no
-            yes_bid_price = self._calculate_bid_price(
-                best_bid=yes_book.best_bid,
-                best_ask=yes_book.best_ask,
-                skew=skew,
-                opposite_best_bid=no_best_bid,
-                opposite_avg_cost=no_avg_cost,
-            )
-        
-        # Calculate NO bid price
-        no_bid_price = None
-        if should_bid_no and no_book.best_bid is not None and no_book.best_ask is not None:
-            yes_best_bid = yes_book.best_bid if yes_book.best_bid is not None else 0.50
-            yes_avg_cost = inv.mu_yes
-            no_bid_price = self._calculate_bid_price(
-                best_bid=no_book.best_bid,
-                best_ask=no_book.best_ask,
-                skew=-skew,
-                opposite_best_bid=yes_best_bid,
-                opposite_avg_cost=yes_avg_cost,
-            )
-        
-        # Update YES bid if needed
-        if should_bid_yes and yes_bid_price is not None:
-            await self._update_bid(Outcome.YES, yes_bid_price)
-            await asyncio.sleep(0.5)
-        elif not should_bid_yes:
-            await self._cancel_bid(Outcome.YES)
-            await asyncio.sleep(0.5)
-        
-        # Update NO bid if needed
-        if should_bid_no and no_bid_price is not None:
-            await self._update_bid(Outcome.NO, no_bid_price)
-            await asyncio.sleep(0.5)
-        elif not should_bid_no:
-            await self._cancel_bid(Outcome.NO)
+        should_bid = {Outcome.YES: True, Outcome.NO: True}
+
+        # Skew lowers our YES bid when long YES and vice versa
+        side_skew_ticks = {Outcome.YES: skew_ticks, Outcome.NO: -skew_ticks}
+        avg_cost = {Outcome.YES: inv.mu_yes, Outcome.NO: inv.mu_no}
+
+        # Profitability cap per side, in ticks: a YES bid is only worth
+        # placing below 1.00 minus what the NO side costs us (avg cost if
+        # we hold NO, else its best bid). Inputs only change on fills and
+        # book updates, so compute once per cycle instead of per call.
+        cap_ticks: dict[Outcome, Price] = {}
+        for oc in OUTCOMES:
+            opp = OPPOSITE[oc]
+            opp_cost = avg_cost[opp]
+            if opp_cost <= 0:
+                opp_best_bid = books[opp].best_bid
+                opp_cost = opp_best_bid if opp_best_bid is not None else 0.50
+            cap_ticks[oc] = min(99, PRICE_SCALE - price_to_ticks(opp_cost))
+
+        # Calculate bid price per side
+        bid_prices: dict[Outcome, Optional[float]] = {}
+        for oc in OUTCOMES:
+            book = books[oc]
+            bid_prices[oc] = None
+            if should_bid[oc] and book.best_bid is not None and book.best_ask is not None:
+                bid_prices[oc] = self._calculate_bid_price(
+                    best_bid=book.best_bid,
+                    best_ask=book.best_ask,
+                    skew_ticks=side_skew_ticks[oc],
+                    cap_ticks=cap_ticks[oc],
+                )
+
+        # Update both sides concurrently - each side is independently
+        # guarded by its placing flag, so the gather collapses the quote
+        # cycle to one round-trip of wall clock instead of four
+        tasks = []
+        for oc in OUTCOMES:
+            if should_bid[oc] and bid_prices[oc] is not None:
+                tasks.append(self._update_bid(oc, bid_prices[oc], order_size))
+            elif not should_bid[oc]:
+                tasks.append(self._cancel_bid(oc))
+
+        if tasks:
+            await asyncio.gather(*tasks)
 
     def _calculate_bid_price(
         self,
         best_bid: float,
         best_ask: float,
-        skew: float,
-        opposite_best_bid: float,
-        opposite_avg_cost: float,
+        skew_ticks: int,
+        cap_ticks: Price,
     ) -> Optional[float]:
         """
         Calculate our bid price using Join-or-Improve logic.
+
+        Thin wrapper around the _calc_bid_ticks kernel: converts prices
+        to integer ticks at the boundary, runs the pure-int math, and
+        handles the skip logging the kernel can't do. The profitability
+        cap is precomputed per cycle by _update_quotes and passed in.
         """
-        spread = round(best_ask - best_bid, 2)
-        
-        if spread > TICK_SIZE + 0.001:
-            raw_bid = best_bid + TICK_SIZE
-        else:
-            raw_bid = best_bid
-        
-        # Apply inventory skew
-        adjusted_bid = raw_bid - skew
-        
-        # Round to tick size
-        adjusted_bid = round(adjusted_bid / TICK_SIZE) * TICK_SIZE
-        adjusted_bid = round(adjusted_bid, 2)
-        
-        # Clamp to valid range
-        adjusted_bid = max(0.01, min(0.99, adjusted_bid))
-        
-        # Ensure we don't cross the book
-        if adjusted_bid >= best_ask:
-            adjusted_bid = best_bid
-            if adjusted_bid >= best_ask:
-                return None
-        
-        # Profitability cap
-        if opposite_avg_cost > 0:
-            effective_opposite_cost = opposite_avg_cost
-        else:
-            effective_opposite_cost = opposite_best_bid
-        
-        max_profitable_bid = round(1.00 - effective_opposite_cost, 2)
-        max_profitable_bid = min(0.99, max_profitable_bid)
-        
-        if adjusted_bid > max_profitable_bid:
-            now = time.time()
-            if now - self._last_skip_log_time >= 30.0:
-                logger.info(f"   ⛔ Skipping bid {adjusted_bid:.2f} > cap {max_profitable_bid:.2f}")
-                self._last_skip_log_time = now
+        bid_t = price_to_ticks(best_bid)
+        ask_t = price_to_ticks(best_ask)
+
+        adjusted_t = _calc_bid_ticks(bid_t, ask_t, skew_ticks, cap_ticks)
+
+        if adjusted_t == -2:  # bid would exceed the profitability cap
+            now_ns = time.monotonic_ns()
+            if now_ns - self._last_skip_log_ns >= 30_000_000_000:
+                logger.info(f"   ⛔ Skipping bid > cap {ticks_to_price(cap_ticks):.2f}")
+                self._last_skip_log_ns = now_ns
+            return None
+        if adjusted_t < 0:  # crossed book
             return None
-        
-        return adjusted_bid
 
-    async def _update_bid(self, outcome: Outcome, price: float):
-        """Update or place a bid order for the given outcome."""
-        if self.state.mode == StrategyMode.STOPPED or self._halt_new_orders:
+        return ticks_to_price(adjusted_t)
+
+    async def _update_bid(self, outcome: Outcome, price: float,
+                          order_size: Optional[float] = None):
+        """
+        Update or place a bid order for the given outcome.
+
+        Args:
+            outcome: Which side to quote.
+            price: Target bid price.
+            order_size: Size for the new order. _update_quotes computes it
+                        once per cycle and passes it for both sides;
+                        derived from current inventory when omitted.
+        """
+        if self.state.mode is StrategyMode.STOPPED or self._halt_new_orders:
             return
         inv = self.state.inventory
-        if outcome == Outcome.YES:
-            current_order = self.state.bid_order_yes
-            last_price = self.state.last_bid_price_yes
-            placing_flag = "_placing_yes"
-        else:
-            current_order = self.state.bid_order_no
-            last_price = self.state.last_bid_price_no
-            placing_flag = "_placing_no"
-        
+        current_order = self.state.bid_orders[outcome]
+        last_price = self.state.last_bid_prices[outcome]
+
         if last_price is not None and abs(price - last_price) < 0.005:
             return
-        
-        if getattr(self, placing_flag):
+
+        # Skip rather than queue when this side is already mid-update:
+        # the next cycle will re-quote with fresher prices anyway
+        lock = self._side_locks[outcome]
+        if lock.locked():
             return
-        setattr(self, placing_flag, True)
-        
-        try:
-            if current_order and current_order.is_active:
-                if current_order.order_id in self._pending_cancel:
+
+        async with lock:
+            try:
+                if current_order and current_order.is_active:
+                    meta = self._orders.get(current_order.order_id)
+                    if meta is not None and meta.pending_cancel:
+                        # Cycle left work undone - drop the input-hash
+                        # gate so the next tick retries even if the
+                        # books haven't moved
+                        self._last_inputs_hash = None
+                        return
+
+                    await self._throttle.acquire()
+                    cancel_success = await self.client.cancel_order(current_order.order_id)
+
+                    if not cancel_success:
+                        if meta is None:
+                            meta = self._orders[current_order.order_id] = OrderMeta(outcome)
+                        meta.pending_cancel = True
+                        self._last_inputs_hash = None
+                        return
+
+                    self._untrack_order(current_order.order_id)
+
+                    self.state.bid_orders[outcome] = None
+                    self.state.last_bid_prices[outcome] = None
+
+                if self._halt_new_orders or self.state.mode is StrategyMode.STOPPED:
                     return
 
-                cancel_success = await self.client.cancel_order(current_order.order_id)
-                await asyncio.sleep(0.5)
+                token_id = self.config.token_id_yes if outcome is Outcome.YES else self.config.token_id_no
+                if order_size is None:
+                    order_size = self.config.get_order_size(inv.delta_q)
 
-                if not cancel_success:
-                    self._pending_cancel.add(current_order.order_id)
-                    return
+                await self._throttle.acquire()
+                order = await self.client.place_limit_order(
+                    token_id=token_id,
+                    side=Side.BUY,
+                    price=price,
+                    size=order_size,
+                    time_in_force="GTC",
+                )
 
-                self._pending_cancel.discard(current_order.order_id)
-                self._untrack_order(current_order.order_id)
+                if order:
+                    self._remember_order(order.order_id, outcome)
+                    self._track_order(order.order_id)
 
-                if outcome == Outcome.YES:
-                    self.state.bid_order_yes = None
-                    self.state.last_bid_price_yes = None
-                else:
-                    self.state.bid_order_no = None
-                    self.state.last_bid_price_no = None
-            
-            if self._halt_new_orders or self.state.mode == StrategyMode.STOPPED:
-                return
-            
-            token_id = self.config.token_id_yes if outcome == Outcome.YES else self.config.token_id_no
-            order_size = self.config.get_order_size(inv.delta_q)
-            
-            order = await self.client.place_limit_order(
-                token_id=token_id,
-                side=Side.BUY,
-                price=price,
-                size=order_size,
-                time_in_force="GTC",
-            )
-            
-            if order:
-                self._remember_order(order.order_id, outcome)
-                self._track_order(order.order_id)
-                
-                if outcome == Outcome.YES:
-                    self.state.bid_order_yes = order
-                    self.state.last_bid_price_yes = price
+                    self.state.bid_orders[outcome] = order
+                    self.state.last_bid_prices[outcome] = price
+
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"📝 Placed {outcome.value} bid @ {price:.2f} × {order_size:.1f}")
                 else:
-                    self.state.bid_order_no = order
-                    self.state.last_bid_price_no = price
-                
-                logger.debug(f"📝 Placed {outcome.value} bid @ {price:.2f} × {order_size:.1f}")
-        except Exception as e:
-            logger.error(f"   Error updating {outcome.value} bid: {e}")
-        finally:
-            setattr(self, placing_flag, False)
+                    # Placement failed - retry next tick even if the
+                    # books haven't moved
+                    self._last_inputs_hash = None
+            except Exception as e:
+                logger.error(f"   Error updating {outcome.value} bid: {e}")
+                self._last_inputs_hash = None
 
     async def _cancel_bid(self, outcome: Outcome):
         """Cancel a bid order for the given outcome."""
-        if outcome == Outcome.YES:
-            order = self.state.bid_order_yes
-            if order and order.is_active:
-                if order.order_id in self._pending_cancel:
-                    return
-                ok = await self.client.cancel_order(order.order_id)
-                if not ok:
-                    self._pending_cancel.add(order.order_id)
-                    return
-                self._pending_cancel.discard(order.order_id)
-                self._untrack_order(order.order_id)
-                self.state.bid_order_yes = None
-                self.state.last_bid_price_yes = None
-        else:
-            order = self.state.bid_order_no
-            if order and order.is_active:
-                if order.order_id in self._pending_cancel:
-                    return
-                ok = await self.client.cancel_order(order.order_id)
-                if not ok:
-                    self._pending_cancel.add(order.order_id)
-                    return
-                self._pending_cancel.discard(order.order_id)
-                self._untrack_order(order.order_id)
-                self.state.bid_order_no = None
-                self.state.last_bid_price_no = None
+        order = self.state.bid_orders[outcome]
+        if order and order.is_active:
+            meta = self._orders.get(order.order_id)
+            if meta is not None and meta.pending_cancel:
+                self._last_inputs_hash = None
+                return
+            await self._throttle.acquire()
+            ok = await self.client.cancel_order(order.order_id)
+            if not ok:
+                if meta is None:
+                    meta = self._orders[order.order_id] = OrderMeta(outcome)
+                meta.pending_cancel = True
+                # Cancel still pending - keep the cycle gate open so the
+                # next tick retries even on unchanged books
+                self._last_inputs_hash = None
+                return
+            self._untrack_order(order.order_id)
+            self.state.bid_orders[outcome] = None
+            self.state.last_bid_prices[outcome] = None
 
     def on_fill(self, order_id: str, outcome: Outcome, price: float, size: float):
-        """Handle a fill event from WebSocket."""
+        """
+        Queue a fill event for the consumer task.
+
+        Called from the user-channel WebSocket thread, so the hand-off
+        goes through call_soon_threadsafe; the WS thread does no strategy
+        bookkeeping itself. Falls back to applying inline when no event
+        loop is running (direct calls before start()).
+        """
+        event = FillEvent(order_id, outcome, price, size)
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            loop.call_soon_threadsafe(self._fill_queue.put_nowait, event)
+        else:
+            self._apply_fills([event])
+
+    def _drain_fill_queue(self) -> list:
+        """Pull everything currently sitting in the fill queue."""
+        q = self._fill_queue
+        batch = []
+        while not q.empty():
+            batch.append(q.get_nowait())
+        return batch
+
+    async def _fill_consumer(self):
+        """
+        Apply queued fills on the event loop.
+
+        Bursts (e.g. YES and NO filling in the same tick) are drained
+        into one batch and applied in a single pass, so inventory is
+        settled once before the next quote cycle reads it.
+        """
+        q = self._fill_queue
+        while True:
+            batch = [await q.get()]
+            while not q.empty():
+                batch.append(q.get_nowait())
+            self._apply_fills(batch)
+
+    def _apply_fills(self, events: list):
+        """Apply a batch of fill events to inventory and order state."""
+        for event in events:
+            self._apply_fill(event)
+
+    def _apply_fill(self, event: FillEvent):
+        """Record one fill and update bookkeeping."""
+        order_id = event.order_id
+        outcome = event.outcome
+        price = event.price
+        size = event.size
         inv = self.state.inventory
-        
+
+
         order_type = "UNKNOWN"
-        
-        if self.state.bid_order_yes and self.state.bid_order_yes.order_id == order_id:
-            order_type = "BID_YES"
-        elif self.state.bid_order_no and self.state.bid_order_no.order_id == order_id:
-            order_type = "BID_NO"
-        
-        mapped_outcome = self._order_outcome.get(order_id)
-        if mapped_outcome and outcome != mapped_outcome:
-            outcome = mapped_outcome
+        filled_outcome = None
+
+        for oc in OUTCOMES:
+            bid = self.state.bid_orders[oc]
+            if bid and bid.order_id == order_id:
+                order_type = f"BID_{oc.value}"
+                filled_outcome = oc
+                break
 
-        if order_type == "UNKNOWN" and order_id not in self._order_outcome:
+
+        # Single metadata lookup covers outcome mapping, the known-order
+        # check, and the pending-cancel state
+        meta = self._orders.get(order_id)
+        if meta is not None and outcome != meta.outcome:
+            outcome = meta.outcome
+
+        if order_type == "UNKNOWN" and meta is None:
             logger.warning(f"⚠️ Ignoring fill from unknown order: {order_id[:16]}...")
             return
-        
-        logger.info("")
-        logger.info("=" * 60)
-        logger.info(f"🎉 FILL: {order_type}")
-        logger.info(f"   Bought {size:.2f} {outcome.value} @ ${price:.2f}")
-        logger.info(f"   Cost: ${price * size:.2f}")
-        
+
         inv.record_fill(outcome, Side.BUY, price, size)
-        
-        if order_type == "BID_YES":
-            self.state.bid_order_yes = None
-            self.state.last_bid_price_yes = None
-            self._pending_cancel.discard(order_id)
-            self._forget_order(order_id)
-        elif order_type == "BID_NO":
-            self.state.bid_order_no = None
-            self.state.last_bid_price_no = None
-            self._pending_cancel.discard(order_id)
-            self._forget_order(order_id)
-        
-        logger.info(f"   → Inventory: ΔQ={inv.delta_q:.2f} | YES={inv.q_yes:.2f} | NO={inv.q_no:.2f}")
-        logger.info(f"   💵 Locked profit: ${inv.locked_profit:.4f}")
-        logger.info(f"   📊 Total trades: {inv.total_trades}")
-        logger.info("=" * 60)
-        logger.info("")
+
+        if filled_outcome is not None:
+            self.state.bid_orders[filled_outcome] = None
+            self.state.last_bid_prices[filled_outcome] = None
+            # Filled orders leave the manager's tracked set too, so the
+            # persisted recovery file never accumulates dead ids
+            self._untrack_order(order_id)
+
+        # One log record per fill instead of ten - a fill storm pays the
+        # logging fixed cost (record, lock, write) once per event
+        rule = "=" * 60
+        logger.info("\n".join([
+            "",
+            rule,
+            f"🎉 FILL: {order_type}",
+            f"   Bought {size:.2f} {outcome.value} @ ${price:.2f}",
+            f"   Cost: ${price * size:.2f}",
+            f"   → Inventory: ΔQ={inv.delta_q:.2f} | YES={inv.q_yes:.2f} | NO={inv.q_no:.2f}",
+            f"   💵 Locked profit: ${inv.locked_profit:.4f}",
+            f"   📊 Total trades: {inv.total_trades}",
+            rule,
+            "",
+        ]))
 
     def get_active_order_ids(self) -> set:
         """Return set of active order IDs for fill detection."""
-        order_ids = set()
-        if self.state.bid_order_yes and self.state.bid_order_yes.is_active:
-            order_ids.add(self.state.bid_order_yes.order_id)
-        if self.state.bid_order_no and self.state.bid_order_no.is_active:
-            order_ids.add(self.state.bid_order_no.order_id)
-        return order_ids
+        return {
+            order.order_id
+            for order in self.state.bid_orders.values()
+            if order and order.is_active
+        }
 
 
 def build_engine() -> StrategyEngine:
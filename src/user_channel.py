@@ -11,11 +11,11 @@ and provides:
 """
 
 import asyncio
-import json
 import threading
-from typing import Optional, Callable, Set, Dict, Any
+from typing import Optional, Callable, Dict, Any
 from datetime import datetime
 
+import orjson
 from websocket import WebSocketApp
 
 from config import Config, get_config
@@ -60,8 +60,10 @@ class UserChannelManager:
         self._running = False
         self._connected = False
         
-        # Track our order IDs for fill detection
-        self._tracked_order_ids: Set[str] = set()
+        # Track our order IDs for fill detection. A frozenset republished
+        # on mutation: the WS thread reads a consistent snapshot with one
+        # attribute load while the event loop adds/removes orders
+        self._tracked_order_ids: frozenset[str] = frozenset()
         
         # Stats
         self._message_count = 0
@@ -84,12 +86,12 @@ class UserChannelManager:
     
     def track_order(self, order_id: str):
         """Start tracking an order ID for fill detection."""
-        self._tracked_order_ids.add(order_id)
+        self._tracked_order_ids = self._tracked_order_ids | {order_id}
         logger.debug(f"[USER] Tracking order {order_id[:16]}... ({len(self._tracked_order_ids)} total)")
-    
+
     def untrack_order(self, order_id: str):
         """Stop tracking an order ID."""
-        self._tracked_order_ids.discard(order_id)
+        self._tracked_order_ids = self._tracked_order_ids - {order_id}
         logger.debug(f"[USER] Untracked order {order_id[:16]}... ({len(self._tracked_order_ids)} total)")
     
     def start(self):
@@ -158,7 +160,7 @@ class UserChannelManager:
             }
         }
         
-        ws.send(json.dumps(auth_msg))
+        ws.send(orjson.dumps(auth_msg).decode())
         logger.info("[USER] Auth message sent")
         self._connected = True
         
@@ -185,7 +187,7 @@ class UserChannelManager:
             return
         
         try:
-            data = json.loads(message)
+            data = orjson.loads(message)
             event_type = data.get("event_type", "")
             
             if event_type == "trade":
@@ -196,7 +198,7 @@ class UserChannelManager:
                 if self._message_count <= 5:
                     logger.debug(f"[USER] Unknown event: {event_type}")
                     
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.warning(f"[USER] Invalid JSON: {message[:100]}")
         except Exception as e:
             logger.error(f"[USER] Message handling error: {e}")
@@ -275,7 +277,7 @@ class UserChannelManager:
         
         if update_type == "CANCELLATION":
             logger.debug(f"[USER] Order {order_id[:16]}... cancelled")
-            self._tracked_order_ids.discard(order_id)
+            self._tracked_order_ids = self._tracked_order_ids - {order_id}
         
         elif update_type in ("PLACEMENT", "UPDATE"):
             size_matched = float(data.get("size_matched", 0))
@@ -321,7 +323,7 @@ class UserChannelManager:
         
         # Remove from tracked orders (full fill assumed)
         # For partial fills, we'd need to track remaining size
-        self._tracked_order_ids.discard(order_id)
+        self._tracked_order_ids = self._tracked_order_ids - {order_id}
         
         # Trigger callback
         if self.on_fill: